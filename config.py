@@ -0,0 +1,18 @@
+"""
+Application Settings for LMS Explorer
+Provides the process-wide QSettings store for user preferences
+"""
+
+from typing import Optional
+from PyQt5.QtCore import QSettings
+
+
+_settings: Optional[QSettings] = None
+
+
+def get_settings() -> QSettings:
+    """Get the shared QSettings instance, creating it on first use"""
+    global _settings
+    if _settings is None:
+        _settings = QSettings("LMS Explorer", "Settings")
+    return _settings
@@ -3,10 +3,50 @@ Configuration Manager for LMS Explorer
 Handles loading and saving configuration settings
 """
 
+import io
 import os
+import re
 import configparser
-from typing import Dict, List, Optional
-from credential_manager import get_credential_manager
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+from utils import atomic_write_bytes
+
+
+# Section names used for LMS configurations: lms1, lms2, ...
+_LMS_SECTION_RE = re.compile(r'^lms\d+$')
+
+
+def _parse_ini(path: str) -> Dict[str, Dict[str, str]]:
+    """Parse the simple INI layout used by config.ini in a single pass
+    
+    Only plain ``key = value`` lines are supported; keys are lower-cased
+    like configparser does, and comment lines starting with ';' or '#' are
+    skipped.
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current = None
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] in ';#':
+                continue
+            
+            if line.startswith('['):
+                name = line[1:line.find(']')].strip() if ']' in line else line[1:].strip()
+                current = sections.setdefault(name, {})
+                continue
+            
+            if current is None:
+                continue
+            
+            key, sep, value = line.partition('=')
+            if not sep:
+                key, sep, value = line.partition(':')
+            if sep:
+                current[key.strip().lower()] = value.strip()
+    
+    return sections
 
 
 class LMSConfig:
@@ -39,8 +79,8 @@ class LMSConfig:
         return data
     
     @classmethod
-    def from_dict(cls, name: str, data: Dict[str, str]) -> 'LMSConfig':
-        """Create from dictionary"""
+    def from_dict(cls, name: str, data: Mapping[str, str]) -> 'LMSConfig':
+        """Create from a dictionary or any mapping with a compatible get()"""
         return cls(
             name=name,
             url=data.get('url', ''),
@@ -58,33 +98,62 @@ class ConfigManager:
     def __init__(self):
         self.configs: Dict[str, LMSConfig] = {}
         self.config_file = ""
-        self.credential_manager = get_credential_manager()
+        self.credential_manager = None
+        self._autoconnect_key: Optional[str] = None
         
+    def _cred(self):
+        """Get the credential manager, importing it on first use"""
+        if self.credential_manager is None:
+            from credential_manager import get_credential_manager
+            self.credential_manager = get_credential_manager()
+        return self.credential_manager
+    
     def load_config(self, config_file: str):
         """Load configuration from file"""
         self.config_file = config_file
         
-        if not os.path.exists(config_file):
+        try:
+            config = _parse_ini(config_file)
+        except FileNotFoundError:
             return
         
-        config = configparser.ConfigParser()
-        config.read(config_file)
-        
         self.configs.clear()
+        self._autoconnect_key = None
+        all_credentials = None
+        pending_configs = []
+        pending_creds = []
         
         # Load each LMS configuration
-        for section_name in config.sections():
-            if section_name.startswith('lms'):
-                lms_config = LMSConfig.from_dict(section_name, dict(config[section_name]))
+        for section_name, section in config.items():
+            if _LMS_SECTION_RE.match(section_name):
+                lms_config = LMSConfig.from_dict(section_name, section)
                 
                 # If remember_me is enabled, retrieve password from credential manager
                 if lms_config.remember_me:
+                    if all_credentials is None:
+                        all_credentials = self._cred().get_all_credentials()
                     service_name = f"lms_{lms_config.name}_{lms_config.url}"
-                    credentials = self.credential_manager.get_credentials(service_name)
-                    if credentials and credentials.get('remember', False):
-                        lms_config.password = credentials.get('password', '')
+                    cred_data = all_credentials.get(service_name)
+                    if cred_data and cred_data.get('remember', False):
+                        if cred_data.get('keyring', False):
+                            credentials = self._cred().get_credentials(service_name)
+                            lms_config.password = credentials.get('password', '')
+                        else:
+                            pending_configs.append(lms_config)
+                            pending_creds.append(cred_data)
                 
                 self.configs[section_name] = lms_config
+                if lms_config.autoconnect and self._autoconnect_key is None:
+                    self._autoconnect_key = section_name
+        
+        # Decrypt all remembered passwords in one batch; ones stored by older
+        # versions are re-encrypted and rewritten on the next save
+        if pending_creds:
+            cred = self._cred()
+            passwords = cred.decrypt_passwords([cred_data.get('password', '') for cred_data in pending_creds])
+            for lms_config, cred_data, password in zip(pending_configs, pending_creds, passwords):
+                lms_config.password = password
+                cred.upgrade_legacy_password(cred_data, password)
     
     def save_config(self, config_file: str = None):
         """Save configuration to file"""
@@ -103,8 +172,14 @@ class ConfigManager:
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(config_file), exist_ok=True)
         
-        with open(config_file, 'w') as f:
-            config.write(f)
+        # Render in memory first so a failed write never truncates the file
+        buffer = io.StringIO()
+        config.write(buffer)
+        atomic_write_bytes(config_file, buffer.getvalue().encode('utf-8'))
+        
+        # Persist any credential changes alongside the configuration
+        if self.credential_manager is not None:
+            self.credential_manager.flush()
     
     def add_config(self, name: str, url: str, username: str, password: str, 
                    service: str = "moodle_mobile_app", autoconnect: bool = False, remember_me: bool = False):
@@ -120,11 +195,17 @@ class ConfigManager:
             remember_me=remember_me
         )
         self.configs[section_name] = lms_config
+        # The first autoconnect configuration wins; an overwritten section may
+        # have been that one
+        if section_name == self._autoconnect_key:
+            self._reindex_autoconnect()
+        elif autoconnect and self._autoconnect_key is None:
+            self._autoconnect_key = section_name
         
         # Save credentials to credential manager if remember_me is enabled
         if remember_me:
             service_name = f"lms_{name}_{url}"
-            self.credential_manager.save_credentials(
+            self._cred().save_credentials(
                 service_name=service_name,
                 username=username,
                 password=password,
@@ -139,24 +220,31 @@ class ConfigManager:
             # Remove credentials from credential manager if they exist
             if lms_config.remember_me:
                 service_name = f"lms_{lms_config.name}_{lms_config.url}"
-                self.credential_manager.delete_credentials(service_name)
+                self._cred().delete_credentials(service_name)
             
             del self.configs[section_name]
+            if section_name == self._autoconnect_key:
+                self._reindex_autoconnect()
     
     def get_config(self, section_name: str) -> Optional[LMSConfig]:
         """Get a specific LMS configuration"""
         return self.configs.get(section_name)
     
-    def get_all_configs(self) -> Dict[str, LMSConfig]:
-        """Get all LMS configurations"""
-        return self.configs.copy()
+    def get_all_configs(self) -> Mapping[str, LMSConfig]:
+        """Get a read-only view of all LMS configurations"""
+        return MappingProxyType(self.configs)
     
     def get_autoconnect_config(self) -> Optional[LMSConfig]:
         """Get the autoconnect configuration"""
-        for config in self.configs.values():
+        return self.configs.get(self._autoconnect_key) if self._autoconnect_key else None
+    
+    def _reindex_autoconnect(self):
+        """Recompute the autoconnect configuration from scratch"""
+        self._autoconnect_key = None
+        for section_name, config in self.configs.items():
             if config.autoconnect:
-                return config
-        return None
+                self._autoconnect_key = section_name
+                break
     
     def get_config_names(self) -> List[str]:
         """Get list of configuration names"""
@@ -169,3 +257,7 @@ class ConfigManager:
             for key, value in kwargs.items():
                 if hasattr(config, key):
                     setattr(config, key, value)
+            
+            # The first autoconnect configuration in order wins
+            if 'autoconnect' in kwargs:
+                self._reindex_autoconnect()
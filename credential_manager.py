@@ -4,44 +4,122 @@ Handles secure storage and retrieval of passwords and sensitive data
 """
 
 import os
+import atexit
 import sys
 import base64
 import hashlib
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import json
+from concurrent.futures import ThreadPoolExecutor
+from utils import atomic_write_bytes
+
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    _loads = json.loads
+
+try:
+    import keyring
+    from keyring.errors import KeyringError
+    KEYRING_AVAILABLE = True
+except ImportError:
+    KEYRING_AVAILABLE = False
+
+# Older versions wrapped the Fernet token in a second base64 layer; every
+# Fernet token starts with "gAAAAA", which base64-encodes to this prefix
+_LEGACY_TOKEN_PREFIX = 'Z0FBQUFB'
 
 
 class CredentialManager:
     """Manages secure storage of credentials"""
     
+    __slots__ = ('key_file', 'credentials_file', '_machine_fernet', '_master_fernet',
+                 '_creds_cache', '_creds_dirty')
+    
     def __init__(self):
-        self.key_file = os.path.join(os.path.dirname(__file__), '.credential_key')
-        self.credentials_file = os.path.join(os.path.dirname(__file__), '.credentials')
-        self._encryption_key = None
-        self._fernet = None
+        base_dir = os.path.dirname(__file__)
+        self.key_file = os.path.join(base_dir, '.credential_key')
+        self.credentials_file = os.path.join(base_dir, '.credentials')
+        self._machine_fernet = None
+        # (SHA-256 of the master password, Fernet) for the most recent master
+        # password, so the password itself is never kept around
+        self._master_fernet = None
+        self._creds_cache = None
+        self._creds_dirty = False
         
     def _get_encryption_key(self, password: str = None) -> bytes:
         """Generate or retrieve encryption key"""
         if password is None:
-            # Use machine-specific key generation
-            password = self._get_machine_specific_key()
+            # Reuse the machine-specific key derived on a previous run
+            cached_key = self._load_cached_key()
+            if cached_key is not None:
+                return cached_key
+            
+            key = self._derive_key(self._get_machine_specific_key())
+            self._save_cached_key(key)
+            return key
         
-        # Generate key from password
+        return self._derive_key(password)
+    
+    def _derive_key(self, password: str) -> bytes:
+        """Derive a Fernet key from a password"""
         password_bytes = password.encode()
         salt = b'lms_explorer_salt'  # In production, use random salt per installation
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
+        derived = hashlib.pbkdf2_hmac('sha256', password_bytes, salt, 100000, 32)
+        key = base64.urlsafe_b64encode(derived)
         return key
     
+    def _load_cached_key(self):
+        """Load the derived machine key from disk, if present"""
+        try:
+            with open(self.key_file, 'rb') as f:
+                key = f.read()
+        except IOError:
+            return None
+        
+        # A base64-encoded Fernet key is always 44 bytes long
+        if len(key) != 44:
+            return None
+        return key
+    
+    def _save_cached_key(self, key: bytes):
+        """Persist the derived machine key so later runs skip PBKDF2"""
+        try:
+            atomic_write_bytes(self.key_file, key, mode=0o600)
+        except OSError as e:
+            print(f"Error saving encryption key: {e}")
+    
     def _get_machine_specific_key(self) -> str:
         """Generate a machine-specific key for encryption"""
+        fingerprint_file = self.key_file + '.fingerprint'
+        try:
+            with open(fingerprint_file, 'r') as f:
+                fingerprint = f.read().strip()
+            if len(fingerprint) == 32:
+                return fingerprint
+        except IOError:
+            pass
+        
+        fingerprint = self._compute_machine_fingerprint()
+        if fingerprint is None:
+            # Fallback to a simple key
+            return "lms_explorer_default_key"
+        
+        try:
+            atomic_write_bytes(fingerprint_file, fingerprint.encode(), mode=0o600)
+        except OSError as e:
+            print(f"Error saving machine fingerprint: {e}")
+        return fingerprint
+    
+    def _compute_machine_fingerprint(self) -> str:
+        """Hash the machine identifiers, or return None if they are unavailable"""
         try:
             # Try to get machine-specific identifiers
             import platform
@@ -57,32 +135,103 @@ class CredentialManager:
             return hashlib.sha256(combined.encode()).hexdigest()[:32]
             
         except Exception:
-            # Fallback to a simple key
-            return "lms_explorer_default_key"
+            return None
     
-    def _initialize_encryption(self, password: str = None):
-        """Initialize encryption with the given key"""
-        if self._fernet is None:
-            self._encryption_key = self._get_encryption_key(password)
-            self._fernet = Fernet(self._encryption_key)
+    def reset_machine_key(self):
+        """Forget the cached machine fingerprint and derived key"""
+        for path in (self.key_file, self.key_file + '.fingerprint'):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error removing {path}: {e}")
+        self._machine_fernet = None
+    
+    def _get_fernet(self, master_password: str = None):
+        """Get the Fernet instance for the given key, creating it once"""
+        from cryptography.fernet import Fernet
+        if master_password is None:
+            if self._machine_fernet is None:
+                self._machine_fernet = Fernet(self._get_encryption_key())
+            return self._machine_fernet
+        
+        digest = hashlib.sha256(master_password.encode()).digest()
+        if self._master_fernet is None or self._master_fernet[0] != digest:
+            self._master_fernet = (digest, Fernet(self._get_encryption_key(master_password)))
+        return self._master_fernet[1]
     
     def encrypt_password(self, password: str, master_password: str = None) -> str:
         """Encrypt a password for storage"""
-        self._initialize_encryption(master_password)
-        encrypted = self._fernet.encrypt(password.encode())
-        return base64.b64encode(encrypted).decode()
+        # Fernet tokens are already URL-safe base64, so store them as-is
+        return self._get_fernet(master_password).encrypt(password.encode()).decode('ascii')
+    
+    @staticmethod
+    def _is_legacy_token(encrypted_password: str) -> bool:
+        """Check for passwords stored by older versions as base64 of a Fernet token"""
+        return encrypted_password.startswith(_LEGACY_TOKEN_PREFIX)
     
     def decrypt_password(self, encrypted_password: str, master_password: str = None) -> str:
         """Decrypt a password from storage"""
         try:
-            self._initialize_encryption(master_password)
-            encrypted_bytes = base64.b64decode(encrypted_password.encode())
-            decrypted = self._fernet.decrypt(encrypted_bytes)
+            if self._is_legacy_token(encrypted_password):
+                encrypted_bytes = base64.b64decode(encrypted_password.encode())
+            else:
+                encrypted_bytes = encrypted_password.encode('ascii')
+            decrypted = self._get_fernet(master_password).decrypt(encrypted_bytes)
             return decrypted.decode()
         except Exception as e:
             print(f"Error decrypting password: {e}")
             return ""
     
+    def decrypt_passwords(self, encrypted_passwords: list, master_password: str = None) -> list:
+        """Decrypt several passwords, spreading the work over a thread pool"""
+        if not encrypted_passwords:
+            return []
+        
+        # Decrypt the first one serially so the shared Fernet is built only once
+        decrypted = [self.decrypt_password(encrypted_passwords[0], master_password)]
+        remaining = encrypted_passwords[1:]
+        if remaining:
+            workers = min(8, os.cpu_count() or 1, len(remaining))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                decrypted.extend(executor.map(
+                    lambda encrypted: self.decrypt_password(encrypted, master_password),
+                    remaining
+                ))
+        return decrypted
+    
+    def upgrade_legacy_password(self, cred_data: dict, decrypted_password: str,
+                                master_password: str = None):
+        """Re-encrypt a password stored by an older version in the current format on the next flush"""
+        if decrypted_password and self._is_legacy_token(cred_data.get('password', '')):
+            cred_data['password'] = self.encrypt_password(decrypted_password, master_password)
+            self._creds_dirty = True
+    
+    def _load_creds(self) -> dict:
+        """Load the credentials file once and keep it in memory"""
+        if self._creds_cache is None:
+            self._creds_cache = {}
+            try:
+                with open(self.credentials_file, 'rb') as f:
+                    self._creds_cache = _loads(f.read())
+            except FileNotFoundError:
+                pass
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error loading credentials: {e}")
+        return self._creds_cache
+    
+    def flush(self):
+        """Write pending credential changes to disk"""
+        if not self._creds_dirty:
+            return
+        
+        try:
+            atomic_write_bytes(self.credentials_file, _dumps(self._creds_cache), mode=0o600)
+            self._creds_dirty = False
+        except IOError as e:
+            print(f"Error saving credentials: {e}")
+    
     def save_credentials(self, service_name: str, username: str, password: str, 
                         remember: bool = True, master_password: str = None):
         """Save credentials securely"""
@@ -90,95 +239,120 @@ class CredentialManager:
             # If not remembering, just return without saving
             return
         
-        credentials = {}
+        credentials = self._load_creds()
         
-        # Load existing credentials if file exists
-        if os.path.exists(self.credentials_file):
-            try:
-                with open(self.credentials_file, 'r') as f:
-                    credentials = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                credentials = {}
+        # Prefer the OS keyring; the credentials file then only indexes the service
+        if master_password is None and self._keyring_set(service_name, username, password):
+            credentials[service_name] = {
+                'username': username,
+                'remember': remember,
+                'keyring': True
+            }
+            self._creds_dirty = True
+            return
         
         # Encrypt the password
         encrypted_password = self.encrypt_password(password, master_password)
         
-        # Store the credentials
+        # Store the credentials; written to disk on flush()
         credentials[service_name] = {
             'username': username,
             'password': encrypted_password,
             'remember': remember
         }
-        
-        # Save to file
-        try:
-            with open(self.credentials_file, 'w') as f:
-                json.dump(credentials, f, indent=2)
-        except IOError as e:
-            print(f"Error saving credentials: {e}")
+        self._creds_dirty = True
+    
+    def get_all_credentials(self) -> dict:
+        """Get the raw stored credentials mapping; file-backed passwords stay encrypted"""
+        return self._load_creds()
     
     def get_credentials(self, service_name: str, master_password: str = None) -> dict:
         """Retrieve credentials for a service"""
-        if not os.path.exists(self.credentials_file):
-            return {}
+        credentials = self._load_creds()
         
-        try:
-            with open(self.credentials_file, 'r') as f:
-                credentials = json.load(f)
-            
-            if service_name in credentials:
-                cred_data = credentials[service_name]
-                if cred_data.get('remember', False):
-                    # Decrypt the password
-                    decrypted_password = self.decrypt_password(
-                        cred_data['password'], master_password
-                    )
+        if service_name in credentials:
+            cred_data = credentials[service_name]
+            if cred_data.get('remember', False):
+                if cred_data.get('keyring', False):
                     return {
                         'username': cred_data['username'],
-                        'password': decrypted_password,
+                        'password': self._keyring_get(service_name, cred_data['username']),
                         'remember': True
                     }
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading credentials: {e}")
+                
+                # Decrypt the password
+                decrypted_password = self.decrypt_password(
+                    cred_data['password'], master_password
+                )
+                
+                self.upgrade_legacy_password(cred_data, decrypted_password, master_password)
+                
+                return {
+                    'username': cred_data['username'],
+                    'password': decrypted_password,
+                    'remember': True
+                }
         
         return {}
     
     def delete_credentials(self, service_name: str):
         """Delete credentials for a service"""
-        if not os.path.exists(self.credentials_file):
-            return
+        credentials = self._load_creds()
         
-        try:
-            with open(self.credentials_file, 'r') as f:
-                credentials = json.load(f)
-            
-            if service_name in credentials:
-                del credentials[service_name]
-                
-                with open(self.credentials_file, 'w') as f:
-                    json.dump(credentials, f, indent=2)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error deleting credentials: {e}")
+        if service_name in credentials:
+            cred_data = credentials.pop(service_name)
+            if cred_data.get('keyring', False):
+                self._keyring_delete(service_name, cred_data.get('username', ''))
+            self._creds_dirty = True
     
     def list_services(self) -> list:
         """List all services with stored credentials"""
-        if not os.path.exists(self.credentials_file):
-            return []
-        
-        try:
-            with open(self.credentials_file, 'r') as f:
-                credentials = json.load(f)
-            return list(credentials.keys())
-        except (json.JSONDecodeError, IOError):
-            return []
+        return list(self._load_creds().keys())
     
     def clear_all_credentials(self):
         """Clear all stored credentials"""
-        if os.path.exists(self.credentials_file):
-            try:
-                os.remove(self.credentials_file)
-            except IOError as e:
-                print(f"Error clearing credentials: {e}")
+        for service_name, cred_data in self._load_creds().items():
+            if cred_data.get('keyring', False):
+                self._keyring_delete(service_name, cred_data.get('username', ''))
+        
+        self._creds_cache = {}
+        self._creds_dirty = False
+        try:
+            os.remove(self.credentials_file)
+        except FileNotFoundError:
+            pass
+        except IOError as e:
+            print(f"Error clearing credentials: {e}")
+    
+    def _keyring_set(self, service_name: str, username: str, password: str) -> bool:
+        """Store a password in the OS keyring, returning False if unavailable"""
+        if not KEYRING_AVAILABLE:
+            return False
+        try:
+            keyring.set_password(service_name, username, password)
+            return True
+        except KeyringError as e:
+            print(f"Keyring unavailable, using encrypted file: {e}")
+            return False
+    
+    def _keyring_get(self, service_name: str, username: str) -> str:
+        """Read a password from the OS keyring"""
+        if not KEYRING_AVAILABLE:
+            return ""
+        try:
+            return keyring.get_password(service_name, username) or ""
+        except KeyringError as e:
+            print(f"Error reading from keyring: {e}")
+            return ""
+    
+    def _keyring_delete(self, service_name: str, username: str):
+        """Remove a password from the OS keyring"""
+        if not KEYRING_AVAILABLE:
+            return
+        try:
+            keyring.delete_password(service_name, username)
+        except KeyringError as e:
+            print(f"Error deleting from keyring: {e}")
 
 
 # Global credential manager instance
@@ -189,4 +363,5 @@ def get_credential_manager() -> CredentialManager:
     global _credential_manager
     if _credential_manager is None:
         _credential_manager = CredentialManager()
+        atexit.register(_credential_manager.flush)
     return _credential_manager
@@ -3,37 +3,79 @@ Data Model Classes for LMS Explorer
 Concrete implementations of the LMS interface classes
 """
 
-from typing import List, Optional
+import logging
+import sys
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from lms_interface import (ILMS, IUser, ICourse, ICategory, IModule, ISection, 
                            IGradeItem, IUsersGroup, IContent)
 
+logger = logging.getLogger(__name__)
+
+# Marks a cached value that has not been computed yet
+_UNSET: Any = object()
+
+
+class _CachedFilterContent(ABC):
+    """Caches the filter_content string until a contributing field changes"""
+    
+    __slots__ = ('_fc', '_fcl')
+    
+    @abstractmethod
+    def _build_filter_content(self) -> str:
+        """Build the filter content string for this object"""
+        pass
+    
+    def _invalidate_filter(self):
+        self._fc = self._fcl = _UNSET
+    
+    def get_filter_content(self) -> str:
+        fc = self._fc
+        if fc is _UNSET:
+            fc = self._fc = self._build_filter_content()
+        return fc
+    
+    def get_filter_content_lower(self) -> str:
+        """Lower-cased filter content for case-insensitive search"""
+        fcl = self._fcl
+        if fcl is _UNSET:
+            fcl = self._fcl = self.get_filter_content().lower()
+        return fcl
+    
+    filter_content = property(get_filter_content)
+    filter_content_lower = property(get_filter_content_lower)
+
 
 class GradeItem(IGradeItem):
     """Concrete implementation of grade item"""
     
+    __slots__ = ('item_name',)
+    
     def __init__(self, item_name: str = ""):
-        self._item_name = item_name
+        self.item_name = item_name
     
     def get_item_name(self) -> str:
-        return self._item_name
+        return self.item_name
     
     def set_item_name(self, value: str):
-        self._item_name = value
+        self.item_name = value
 
 
-class UsersGroup(IUsersGroup):
+class UsersGroup(_CachedFilterContent, IUsersGroup):
     """Concrete implementation of user group"""
     
+    __slots__ = ('_group_name', '_id', 'users_in_group')
+    
     def __init__(self, group_name: str = "", group_id: int = 0):
         self._group_name = group_name
         self._id = group_id
-        self._users_in_group: List[IUser] = []
-        self._filter_content = ""
+        self.users_in_group: List[IUser] = []
+        self._fc = self._fcl = _UNSET
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._group_name} {self._id}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._group_name} {self._id}"
     
     def get_group_name(self) -> str:
         return self._group_name
@@ -42,23 +84,31 @@ class UsersGroup(IUsersGroup):
         return self._id
     
     def get_users_in_group(self) -> List[IUser]:
-        return self._users_in_group
+        return self.users_in_group
     
     def set_group_name(self, value: str):
         self._group_name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_id(self, value: int):
         self._id = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_users_in_group(self, value: List[IUser]):
-        self._users_in_group = value
+        self.users_in_group = value
+    
+    # Properties to match IUsersGroup interface
+    group_name = property(get_group_name, set_group_name)
+    id = property(get_id, set_id)
 
 
-class User(IUser):
+class User(_CachedFilterContent, IUser):
     """Concrete implementation of user"""
     
+    __slots__ = ('_id', '_first_name', '_last_name', '_email', '_username', '_full_name',
+                 '_joined_name', 'course', 'lms', '_roles', 'other_enrolled_courses', 'last_access',
+                 'last_access_from', 'time_created', 'time_modified', 'notes')
+    
     def __init__(self, user_id: int = 0, first_name: str = "", last_name: str = "", 
                  email: str = ""):
         self._id = user_id
@@ -67,27 +117,47 @@ class User(IUser):
         self._email = email
         self._username = ""
         self._full_name = ""
-        self._course: Optional[ICourse] = None
-        self._lms: Optional[ILMS] = None
+        # "first last", built on first use when no explicit full name is set
+        self._joined_name: Optional[str] = None
+        self.course: Optional[ICourse] = None
+        self.lms: Optional[ILMS] = None
         self._roles: List[str] = []
-        self._other_enrolled_courses: List[ICourse] = []
-        self._last_access = ""
-        self._last_access_from = ""
-        self._time_created = ""
-        self._time_modified = ""
-        self._notes = ""
-        self._filter_content = ""
+        self.other_enrolled_courses: List[ICourse] = []
+        self.last_access = ""
+        self.last_access_from = ""
+        self.time_created = ""
+        self.time_modified = ""
+        self.notes = ""
+        self._fc = self._fcl = _UNSET
+    
+    @classmethod
+    def from_moodle(cls, user_data: dict, course: Optional[ICourse] = None,
+                    lms: Optional[ILMS] = None) -> 'User':
+        """Build a user from a Moodle user record"""
+        user = cls(
+            user_id=user_data.get('id', 0),
+            first_name=user_data.get('firstname', ''),
+            last_name=user_data.get('lastname', ''),
+            email=user_data.get('email', '')
+        )
+        # Fill the remaining fields directly: a new user has no cached filter
+        # text or course role counts for the setters to invalidate
+        user._full_name = user_data.get('fullname', '')
+        user._username = user_data.get('username', '')
+        user.course = course
+        user.lms = lms
+        if 'roles' in user_data:
+            user._roles = [sys.intern(role.get('name', '')) for role in user_data['roles']]
+        return user
     
     def get_course(self) -> Optional[ICourse]:
-        return self._course
+        return self.course
     
     def get_email(self) -> str:
         return self._email
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._first_name} {self._last_name} {self._full_name} {self._username} {self._email} {self._id}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._first_name} {self._last_name} {self._full_name} {self._username} {self._email} {self._id}"
     
     def get_first_name(self) -> str:
         return self._first_name
@@ -95,7 +165,10 @@ class User(IUser):
     def get_full_name(self) -> str:
         if self._full_name:
             return self._full_name
-        return f"{self._first_name} {self._last_name}"
+        joined_name = self._joined_name
+        if joined_name is None:
+            joined_name = self._joined_name = f"{self._first_name} {self._last_name}"
+        return joined_name
     
     def get_id(self) -> int:
         return self._id
@@ -104,105 +177,109 @@ class User(IUser):
         return self._last_name
     
     def get_lms(self) -> Optional[ILMS]:
-        return self._lms
+        return self.lms
     
     def get_roles(self) -> List[str]:
         return self._roles
     
     def set_course(self, value: Optional[ICourse]):
-        self._course = value
+        self.course = value
     
     def set_email(self, value: str):
         self._email = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_first_name(self, value: str):
         self._first_name = value
-        self._filter_content = ""  # Reset filter content
+        self._joined_name = None
+        self._invalidate_filter()
     
     def set_full_name(self, value: str):
         self._full_name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_last_name(self, value: str):
         self._last_name = value
-        self._filter_content = ""  # Reset filter content
+        self._joined_name = None
+        self._invalidate_filter()
     
     def set_lms(self, value: Optional[ILMS]):
-        self._lms = value
+        self.lms = value
     
     def set_roles(self, value: List[str]):
-        self._roles = value
-        self._filter_content = ""  # Reset filter content
+        # Role names come from a small fixed set; interning makes lookups identity checks
+        self._roles = [sys.intern(role) for role in value]
+        # Let the course rebuild its per-role counts on next use
+        invalidate_role_counts = getattr(self.course, '_invalidate_role_counts', None)
+        if invalidate_role_counts is not None:
+            invalidate_role_counts()
     
     def get_username(self) -> str:
         return self._username
     
     def set_username(self, value: str):
         self._username = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def get_other_enrolled_courses(self) -> List[ICourse]:
-        return self._other_enrolled_courses
+        return self.other_enrolled_courses
     
     def get_last_access(self) -> str:
-        return self._last_access
+        return self.last_access
     
     def set_last_access(self, value: str):
-        self._last_access = value
+        self.last_access = value
     
     def get_last_access_from(self) -> str:
-        return self._last_access_from
+        return self.last_access_from
     
     def set_last_access_from(self, value: str):
-        self._last_access_from = value
+        self.last_access_from = value
     
     def get_time_created(self) -> str:
-        return self._time_created
+        return self.time_created
     
     def set_time_created(self, value: str):
-        self._time_created = value
+        self.time_created = value
     
     def get_time_modified(self) -> str:
-        return self._time_modified
+        return self.time_modified
     
     def set_time_modified(self, value: str):
-        self._time_modified = value
+        self.time_modified = value
     
     def get_notes(self) -> str:
-        return self._notes
+        return self.notes
     
     def set_notes(self, value: str):
-        self._notes = value
+        self.notes = value
     
-    # Properties to match IUser interface
-    course = property(get_course, set_course)
+    # Properties to match IUser interface; fields without side effects
+    # (course, lms, ...) are plain slot attributes
     email = property(get_email, set_email)
-    filter_content = property(get_filter_content)
     first_name = property(get_first_name, set_first_name)
     full_name = property(get_full_name)
     id = property(get_id)
     last_name = property(get_last_name, set_last_name)
-    lms = property(get_lms, set_lms)
     roles = property(get_roles, set_roles)
 
 
-class Module(IModule):
+class Module(_CachedFilterContent, IModule):
     """Concrete implementation of module"""
     
+    __slots__ = ('_id', '_mod_name', '_name', 'section', 'contents', 'mod_type')
+    
     def __init__(self, module_id: int = 0, mod_name: str = "", name: str = ""):
         self._id = module_id
         self._mod_name = mod_name
         self._name = name
-        self._section: Optional[ISection] = None
-        self._contents: List[IContent] = []
-        self._mod_type = "unknow"  # Default to unknown module type
-        self._filter_content = ""
+        self.section: Optional[ISection] = None
+        self.contents: List[IContent] = []
+        self.mod_type = "unknow"  # Default to unknown module type
+        self._fc = self._fcl = _UNSET
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._name} {self._mod_name}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._name} {self._mod_name}"
     
     def get_id(self) -> int:
         return self._id
@@ -214,96 +291,114 @@ class Module(IModule):
         return self._name
     
     def get_section(self) -> Optional[ISection]:
-        return self._section
+        return self.section
     
     def set_name(self, value: str):
         self._name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_section(self, value: Optional[ISection]):
-        self._section = value
+        self.section = value
     
     def get_contents(self) -> List[IContent]:
-        return self._contents
+        return self.contents
     
     def get_mod_type(self) -> str:
-        return self._mod_type
+        return self.mod_type
     
     def set_mod_type(self, value: str):
-        self._mod_type = value
+        self.mod_type = sys.intern(value)
     
     def add_content(self, content: IContent):
         """Add content to this module"""
         content.set_module(self)
-        self._contents.append(content)
+        self.contents.append(content)
     
     def remove_content(self, content: IContent):
         """Remove content from this module"""
-        if content in self._contents:
-            self._contents.remove(content)
-            content.set_module(None)
+        try:
+            self.contents.remove(content)
+        except ValueError:
+            return
+        content.set_module(None)
+    
+    # Properties to match IModule interface
+    id = property(get_id)
+    mod_name = property(get_mod_name)
+    name = property(get_name, set_name)
 
 
-class Section(ISection):
+class Section(_CachedFilterContent, ISection):
     """Concrete implementation of section"""
     
+    __slots__ = ('_id', '_name', 'course', 'modules')
+    
     def __init__(self, section_id: int = 0, name: str = ""):
         self._id = section_id
         self._name = name
-        self._course: Optional[ICourse] = None
-        self._modules: List[IModule] = []
-        self._filter_content = ""
+        self.course: Optional[ICourse] = None
+        self.modules: List[IModule] = []
+        self._fc = self._fcl = _UNSET
     
     def get_course(self) -> ICourse:
-        return self._course
+        return self.course
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._name} {self._id}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._name} {self._id}"
     
     def get_id(self) -> int:
         return self._id
     
     def get_modules(self) -> List[IModule]:
-        return self._modules
+        return self.modules
     
     def get_name(self) -> str:
         return self._name
     
     def set_name(self, value: str):
         self._name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_course(self, value: ICourse):
-        self._course = value
+        self.course = value
     
     def add_module(self, module: IModule):
         """Add a module to this section"""
         module.set_section(self)
-        self._modules.append(module)
+        self.modules.append(module)
     
     def remove_module(self, module: IModule):
         """Remove a module from this section"""
-        if module in self._modules:
-            self._modules.remove(module)
-            module.set_section(None)
+        try:
+            self.modules.remove(module)
+        except ValueError:
+            return
+        module.set_section(None)
+    
+    # Properties to match ISection interface
+    id = property(get_id)
+    name = property(get_name, set_name)
 
 
-class Course(ICourse):
+class Course(_CachedFilterContent, ICourse):
     """Concrete implementation of course"""
     
+    __slots__ = ('_id', '_name', '_display_name', '_full_name', '_short_name', 'category',
+                 'lms', 'enrolled_users', 'user_groups', 'grade_items', '_course_content',
+                 '_course_roles', '_group_mode', '_start_date', '_end_date', '_time_created',
+                 '_time_modified', '_role_counts')
+    
     def __init__(self, course_id: int = 0, name: str = ""):
         self._id = course_id
         self._name = name
         self._display_name = name
         self._full_name = name
         self._short_name = ""
-        self._category: Optional[ICategory] = None
-        self._lms: Optional[ILMS] = None
-        self._enrolled_users: List[IUser] = []
-        self._user_groups: List[IUsersGroup] = []
-        self._grade_items: List[IGradeItem] = []
+        self.category: Optional[ICategory] = None
+        self.lms: Optional[ILMS] = None
+        self.enrolled_users: List[IUser] = []
+        self.user_groups: List[IUsersGroup] = []
+        self.grade_items: List[IGradeItem] = []
         self._course_content: List[ISection] = []
         self._course_roles: List[str] = []
         self._group_mode = 0
@@ -311,10 +406,11 @@ class Course(ICourse):
         self._end_date = ""
         self._time_created = ""
         self._time_modified = ""
-        self._filter_content = ""
+        self._role_counts: Optional[Counter] = Counter()
+        self._fc = self._fcl = _UNSET
     
     def get_category(self) -> Optional[ICategory]:
-        return self._category
+        return self.category
     
     def get_course_content(self) -> List[ISection]:
         return self._course_content
@@ -323,66 +419,77 @@ class Course(ICourse):
         return self._course_roles
     
     def get_enrolled_users(self) -> List[IUser]:
-        return self._enrolled_users
+        return self.enrolled_users
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._name} {self._id}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._name} {self._id}"
     
     def get_grade_items(self) -> List[IGradeItem]:
-        return self._grade_items
+        return self.grade_items
     
     def get_id(self) -> int:
         return self._id
     
     def get_lms(self) -> Optional[ILMS]:
-        return self._lms
+        return self.lms
     
     def get_name(self) -> str:
         return self._name
     
     def get_user_groups(self) -> List[IUsersGroup]:
-        return self._user_groups
+        return self.user_groups
     
     def set_category(self, value: Optional[ICategory]):
-        self._category = value
+        self.category = value
     
     def set_lms(self, value: Optional[ILMS]):
-        self._lms = value
+        self.lms = value
     
     def set_name(self, value: str):
         self._name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def add_enrolled_user(self, user: IUser):
         """Add an enrolled user to the course"""
         user.set_course(self)
-        self._enrolled_users.append(user)
+        self.enrolled_users.append(user)
+        if self._role_counts is not None:
+            self._role_counts.update(set(user.get_roles()))
     
     def remove_enrolled_user(self, user: IUser):
         """Remove an enrolled user from the course"""
-        if user in self._enrolled_users:
-            self._enrolled_users.remove(user)
-            user.set_course(None)
+        try:
+            self.enrolled_users.remove(user)
+        except ValueError:
+            return
+        user.set_course(None)
+        if self._role_counts is not None:
+            self._role_counts.subtract(set(user.get_roles()))
+    
+    def _invalidate_role_counts(self):
+        self._role_counts = None
     
     def add_user_group(self, group: IUsersGroup):
         """Add a user group to the course"""
-        self._user_groups.append(group)
+        self.user_groups.append(group)
     
     def remove_user_group(self, group: IUsersGroup):
         """Remove a user group from the course"""
-        if group in self._user_groups:
-            self._user_groups.remove(group)
+        try:
+            self.user_groups.remove(group)
+        except ValueError:
+            pass
     
     def add_grade_item(self, item: IGradeItem):
         """Add a grade item to the course"""
-        self._grade_items.append(item)
+        self.grade_items.append(item)
     
     def remove_grade_item(self, item: IGradeItem):
         """Remove a grade item from the course"""
-        if item in self._grade_items:
-            self._grade_items.remove(item)
+        try:
+            self.grade_items.remove(item)
+        except ValueError:
+            pass
     
     def add_section(self, section: ISection):
         """Add a section to the course content"""
@@ -391,13 +498,15 @@ class Course(ICourse):
     
     def remove_section(self, section: ISection):
         """Remove a section from the course content"""
-        if section in self._course_content:
+        try:
             self._course_content.remove(section)
+        except ValueError:
+            pass
     
-    def get_course_content_from_lms(self):
-        """Get course content from LMS"""
-        if not self._lms or not self._lms.is_connected():
-            print("LMS not connected")
+    def fetch_course_content(self):
+        """Load course content from the LMS"""
+        if not self.lms or not self.lms.is_connected():
+            logger.warning("LMS not connected")
             return self._course_content
         
         try:
@@ -406,12 +515,12 @@ class Course(ICourse):
             
             # Create a REST client with the LMS connection details
             rest_client = MoodleRestClient(
-                host=self._lms.get_host(),
-                username=self._lms.get_username(),
-                password=self._lms.get_password(),
-                service=self._lms.get_service()
+                host=self.lms.get_host(),
+                username=self.lms.get_username(),
+                password=self.lms.get_password(),
+                service=self.lms.get_service()
             )
-            rest_client.token = self._lms.get_token()
+            rest_client.token = self.lms.get_token()
             
             # Get course content
             content_data = rest_client.get_course_content(self._id)
@@ -455,19 +564,19 @@ class Course(ICourse):
                     
                     self._course_content.append(section)
                     
-                print(f"Loaded {len(self._course_content)} sections for course '{self._name}'")
+                logger.info("Loaded %d sections for course '%s'", len(self._course_content), self._name)
             else:
-                print(f"No content found for course '{self._name}'")
+                logger.info("No content found for course '%s'", self._name)
                 
-        except Exception as e:
-            print(f"Error loading course content: {e}")
+        except Exception:
+            logger.exception("Error loading course content")
         
         return self._course_content
     
-    def get_course_roles(self, course_roles: List[str]):
-        """Get course roles"""
-        if not self._lms or not self._lms.is_connected():
-            print("LMS not connected")
+    def fetch_course_roles(self):
+        """Load course roles from the LMS"""
+        if not self.lms or not self.lms.is_connected():
+            logger.warning("LMS not connected")
             return self._course_roles
         
         try:
@@ -476,12 +585,12 @@ class Course(ICourse):
             
             # Create a REST client with the LMS connection details
             rest_client = MoodleRestClient(
-                host=self._lms.get_host(),
-                username=self._lms.get_username(),
-                password=self._lms.get_password(),
-                service=self._lms.get_service()
+                host=self.lms.get_host(),
+                username=self.lms.get_username(),
+                password=self.lms.get_password(),
+                service=self.lms.get_service()
             )
-            rest_client.token = self._lms.get_token()
+            rest_client.token = self.lms.get_token()
             
             # Get enrolled users for this course
             enrolled_users_data = rest_client.get_enrolled_users_by_course_id(self._id)
@@ -495,24 +604,24 @@ class Course(ICourse):
                 for user_data in enrolled_users_data:
                     if 'roles' in user_data:
                         for role in user_data['roles']:
-                            unique_roles.add(role.get('name', 'Unknown'))
+                            unique_roles.add(sys.intern(role.get('name', 'Unknown')))
                 
                 # Convert to list and sort
                 self._course_roles = sorted(list(unique_roles))
-                print(f"Found {len(self._course_roles)} roles in course '{self._name}'")
+                logger.info("Found %d roles in course '%s'", len(self._course_roles), self._name)
             else:
-                print(f"No enrolled users found for course '{self._name}'")
+                logger.info("No enrolled users found for course '%s'", self._name)
                 
-        except Exception as e:
-            print(f"Error loading course roles: {e}")
+        except Exception:
+            logger.exception("Error loading course roles")
         
         return self._course_roles
     
     def get_grade_book(self):
         """Get grade book"""
-        if not self._lms or not self._lms.is_connected():
-            print("LMS not connected")
-            return self._grade_items
+        if not self.lms or not self.lms.is_connected():
+            logger.warning("LMS not connected")
+            return self.grade_items
         
         try:
             # Get grade book from Moodle REST API
@@ -520,49 +629,65 @@ class Course(ICourse):
             
             # Create a REST client with the LMS connection details
             rest_client = MoodleRestClient(
-                host=self._lms.get_host(),
-                username=self._lms.get_username(),
-                password=self._lms.get_password(),
-                service=self._lms.get_service()
+                host=self.lms.get_host(),
+                username=self.lms.get_username(),
+                password=self.lms.get_password(),
+                service=self.lms.get_service()
             )
-            rest_client.token = self._lms.get_token()
+            rest_client.token = self.lms.get_token()
             
             # Get grade items for this course
             grade_items_data = rest_client.get_users_grade_book(self._id)
             
             if grade_items_data:
                 # Clear existing grade items
-                self._grade_items.clear()
+                self.grade_items.clear()
                 
                 # Create grade items from API response
                 for grade_item_data in grade_items_data:
                     grade_item = GradeItem(
                         item_name=grade_item_data.get('name', 'Unnamed Grade Item')
                     )
-                    self._grade_items.append(grade_item)
+                    self.grade_items.append(grade_item)
                 
-                print(f"Loaded {len(self._grade_items)} grade items for course '{self._name}'")
+                logger.info("Loaded %d grade items for course '%s'", len(self.grade_items), self._name)
             else:
-                print(f"No grade items found for course '{self._name}'")
+                logger.info("No grade items found for course '%s'", self._name)
                 
-        except Exception as e:
-            print(f"Error loading grade book: {e}")
+        except Exception:
+            logger.exception("Error loading grade book")
         
-        return self._grade_items
+        return self.grade_items
     
     def get_user_count_by_role(self, role: str) -> int:
         """Get user count by role"""
-        count = 0
-        for user in self._enrolled_users:
-            if role in user.get_roles():
-                count += 1
-        return count
+        if self._role_counts is None:
+            # Read the roles slot directly instead of calling get_roles() per user
+            self._role_counts = Counter(
+                role_name for user in self.enrolled_users for role_name in set(user._roles)
+            )
+        return self._role_counts.get(role, 0)
     
     def refresh_enrolled_users(self):
         """Refresh enrolled users"""
-        if not self._lms or not self._lms.is_connected():
-            print("LMS not connected")
-            return self._enrolled_users
+        enrolled_users_data = self.fetch_enrolled_users_data()
+        if enrolled_users_data is not None:
+            self.apply_enrolled_users_data(enrolled_users_data)
+        return self.enrolled_users
+    
+    def fetch_enrolled_users_data(self) -> Optional[List[dict]]:
+        """
+        Fetch the raw enrolled users records from the LMS
+        
+        Only talks to the REST API and leaves the course untouched, so it is
+        safe to call from a worker thread.
+        
+        Returns:
+            The Moodle user records, or None if they could not be fetched
+        """
+        if not self.lms or not self.lms.is_connected():
+            logger.warning("LMS not connected")
+            return None
         
         try:
             # Get enrolled users from Moodle REST API
@@ -570,54 +695,38 @@ class Course(ICourse):
             
             # Create a REST client with the LMS connection details
             rest_client = MoodleRestClient(
-                host=self._lms.get_host(),
-                username=self._lms.get_username(),
-                password=self._lms.get_password(),
-                service=self._lms.get_service()
+                host=self.lms.get_host(),
+                username=self.lms.get_username(),
+                password=self.lms.get_password(),
+                service=self.lms.get_service()
             )
-            rest_client.token = self._lms.get_token()
+            rest_client.token = self.lms.get_token()
             
             # Get enrolled users for this course
-            enrolled_users_data = rest_client.get_enrolled_users_by_course_id(self._id)
+            return rest_client.get_enrolled_users_by_course_id(self._id) or []
             
-            if enrolled_users_data:
-                # Clear existing enrolled users
-                self._enrolled_users.clear()
-                
-                # Create user objects from API response
-                for user_data in enrolled_users_data:
-                    user = User(
-                        user_id=user_data.get('id', 0),
-                        first_name=user_data.get('firstname', ''),
-                        last_name=user_data.get('lastname', ''),
-                        email=user_data.get('email', '')
-                    )
-                    user.set_full_name(user_data.get('fullname', ''))
-                    user.set_username(user_data.get('username', ''))
-                    user.set_course(self)
-                    user.set_lms(self._lms)
-                    
-                    # Set user roles
-                    if 'roles' in user_data:
-                        roles = [role.get('name', '') for role in user_data['roles']]
-                        user.set_roles(roles)
-                    
-                    self._enrolled_users.append(user)
-                
-                print(f"Refreshed {len(self._enrolled_users)} enrolled users for course '{self._name}'")
-            else:
-                print(f"No enrolled users found for course '{self._name}'")
-                
-        except Exception as e:
-            print(f"Error refreshing enrolled users: {e}")
-        
-        return self._enrolled_users
+        except Exception:
+            logger.exception("Error refreshing enrolled users")
+            return None
+    
+    def apply_enrolled_users_data(self, enrolled_users_data: List[dict]):
+        """Replace the enrolled users with ones built from fetched Moodle records"""
+        if enrolled_users_data:
+            lms = self.lms
+            self.enrolled_users[:] = [
+                User.from_moodle(user_data, self, lms) for user_data in enrolled_users_data
+            ]
+            self._invalidate_role_counts()
+            
+            logger.info("Refreshed %d enrolled users for course '%s'", len(self.enrolled_users), self._name)
+        else:
+            logger.info("No enrolled users found for course '%s'", self._name)
     
     def refresh_user_groups(self):
         """Refresh user groups"""
-        if not self._lms or not self._lms.is_connected():
-            print("LMS not connected")
-            return self._user_groups
+        if not self.lms or not self.lms.is_connected():
+            logger.warning("LMS not connected")
+            return self.user_groups
         
         try:
             # Get user groups from Moodle REST API
@@ -625,19 +734,19 @@ class Course(ICourse):
             
             # Create a REST client with the LMS connection details
             rest_client = MoodleRestClient(
-                host=self._lms.get_host(),
-                username=self._lms.get_username(),
-                password=self._lms.get_password(),
-                service=self._lms.get_service()
+                host=self.lms.get_host(),
+                username=self.lms.get_username(),
+                password=self.lms.get_password(),
+                service=self.lms.get_service()
             )
-            rest_client.token = self._lms.get_token()
+            rest_client.token = self.lms.get_token()
             
             # Get user groups for this course
             groups_data = rest_client.get_user_groups_by_course_id(self._id)
             
             if groups_data:
                 # Clear existing user groups
-                self._user_groups.clear()
+                self.user_groups.clear()
                 
                 # Create group objects from API response
                 for group_data in groups_data:
@@ -659,145 +768,157 @@ class Course(ICourse):
                             user.set_full_name(member_data.get('fullname', ''))
                             user.set_username(member_data.get('username', ''))
                             user.set_course(self)
-                            user.set_lms(self._lms)
+                            user.set_lms(self.lms)
                             members.append(user)
                         group.set_users_in_group(members)
                     
-                    self._user_groups.append(group)
+                    self.user_groups.append(group)
                 
-                print(f"Refreshed {len(self._user_groups)} user groups for course '{self._name}'")
+                logger.info("Refreshed %d user groups for course '%s'", len(self.user_groups), self._name)
             else:
-                print(f"No user groups found for course '{self._name}'")
+                logger.info("No user groups found for course '%s'", self._name)
                 
-        except Exception as e:
-            print(f"Error refreshing user groups: {e}")
+        except Exception:
+            logger.exception("Error refreshing user groups")
         
-        return self._user_groups
+        return self.user_groups
     
-    # Properties to match ICourse interface
-    category = property(get_category, set_category)
+    # Properties to match ICourse interface; category, lms, enrolled_users,
+    # user_groups and grade_items are plain slot attributes
     course_content = property(get_course_content)
     course_roles = property(get_course_roles)
-    enrolled_users = property(get_enrolled_users)
-    filter_content = property(get_filter_content)
-    grade_items = property(get_grade_items)
     id = property(get_id)
-    lms = property(get_lms, set_lms)
     name = property(get_name, set_name)
-    user_groups = property(get_user_groups)
 
 
-class Category(ICategory):
+class Category(_CachedFilterContent, ICategory):
     """Concrete implementation of category"""
     
+    __slots__ = ('_id', '_name', 'lms', 'courses', 'categories', 'parent_category')
+    
     def __init__(self, category_id: int = 0, name: str = ""):
         self._id = category_id
         self._name = name
-        self._lms: Optional[ILMS] = None
-        self._courses: List[ICourse] = []
-        self._categories: List[ICategory] = []
-        self._parent_category = 0
-        self._filter_content = ""
+        self.lms: Optional[ILMS] = None
+        self.courses: List[ICourse] = []
+        self.categories: List[ICategory] = []
+        self.parent_category = 0
+        self._fc = self._fcl = _UNSET
     
     def get_courses(self) -> List[ICourse]:
-        return self._courses
+        return self.courses
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._name} {self._id}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._name} {self._id}"
     
     def get_id(self) -> int:
         return self._id
     
     def get_lms(self) -> Optional[ILMS]:
-        return self._lms
+        return self.lms
     
     def get_name(self) -> str:
         return self._name
     
     def set_lms(self, value: Optional[ILMS]):
-        self._lms = value
+        self.lms = value
     
     def set_name(self, value: str):
         self._name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def add_course(self, course: ICourse):
         """Add a course to this category"""
         course.set_category(self)
-        self._courses.append(course)
+        self.courses.append(course)
+    
+    def add_courses(self, courses: List[ICourse]):
+        """Add several courses to this category at once"""
+        for course in courses:
+            course.set_category(self)
+        self.courses.extend(courses)
     
     def remove_course(self, course: ICourse):
         """Remove a course from this category"""
-        if course in self._courses:
-            self._courses.remove(course)
-            course.set_category(None)
+        try:
+            self.courses.remove(course)
+        except ValueError:
+            return
+        course.set_category(None)
     
     def get_categories(self) -> List[ICategory]:
-        return self._categories
+        return self.categories
     
     def get_courses_count(self) -> int:
-        return len(self._courses)
+        return len(self.courses)
     
     def get_parent_category(self) -> int:
-        return self._parent_category
+        return self.parent_category
     
     def set_parent_category(self, value: int):
-        self._parent_category = value
+        self.parent_category = value
     
     def get_sub_categories_count(self) -> int:
-        return len(self._categories)
+        return len(self.categories)
     
     def add_category(self, category: ICategory):
         """Add a sub-category to this category"""
-        self._categories.append(category)
+        self.categories.append(category)
     
     def remove_category(self, category: ICategory):
         """Remove a sub-category from this category"""
-        if category in self._categories:
-            self._categories.remove(category)
+        try:
+            self.categories.remove(category)
+        except ValueError:
+            pass
     
-    # Properties to match ICategory interface
-    courses = property(get_courses)
-    filter_content = property(get_filter_content)
+    # Properties to match ICategory interface; courses and lms are plain
+    # slot attributes
     id = property(get_id)
-    lms = property(get_lms, set_lms)
     name = property(get_name, set_name)
+    sub_categories_count = property(get_sub_categories_count)
 
 
-class LMS(ILMS):
+class LMS(_CachedFilterContent, ILMS):
     """Concrete implementation of LMS"""
     
+    __slots__ = ('_name', '_host', 'token', 'user', 'categories', '_courses', 'enrolled_courses',
+                 'flat_courses', 'auto_connect', 'id', 'password', 'service', 'username',
+                 'moodle_client', '_categories_by_id', '_courses_by_id', '_unbuilt_courses')
+    
     def __init__(self, name: str = "", host: str = ""):
         self._name = name
         self._host = host
-        self._token = ""
-        self._user: Optional[IUser] = None
-        self._categories: List[ICategory] = []
+        self.token = ""
+        self.user: Optional[IUser] = None
+        self.categories: List[ICategory] = []
         self._courses: List[ICourse] = []
-        self._enrolled_courses: List[ICourse] = []
-        self._flat_courses: List[ICourse] = []
-        self._auto_connect = False
-        self._id = ""
-        self._password = ""
-        self._service = ""
-        self._username = ""
-        self._filter_content = ""
+        self._categories_by_id: Dict[int, ICategory] = {}
+        self._courses_by_id: Dict[int, ICourse] = {}
+        # Names of loaded courses not yet built as Course objects, by id; only the
+        # columns a Course needs are kept rather than the whole Moodle row
+        self._unbuilt_courses: Dict[int, Optional[str]] = {}
+        self.enrolled_courses: List[ICourse] = []
+        self.flat_courses: List[ICourse] = []
+        self.auto_connect = False
+        self.id = ""
+        self.password = ""
+        self.service = ""
+        self.username = ""
+        self._fc = self._fcl = _UNSET
+        self.moodle_client = None
     
     def get_categories(self) -> List[ICategory]:
-        return self._categories
+        return self.categories
     
     def get_courses(self) -> List[ICourse]:
         return self._courses
     
     def get_enrolled_courses(self) -> List[ICourse]:
-        return self._enrolled_courses
+        return self.enrolled_courses
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._name} {self._host}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._name} {self._host}"
     
     def get_host(self) -> str:
         return self._host
@@ -806,21 +927,21 @@ class LMS(ILMS):
         return self._name
     
     def get_token(self) -> str:
-        return self._token
+        return self.token
     
     def get_user(self) -> Optional[IUser]:
-        return self._user
+        return self.user
     
     def set_host(self, value: str):
         self._host = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_name(self, value: str):
         self._name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_token(self, value: str):
-        self._token = value
+        self.token = value
     
     def connect(self, username: str, password: str, service: str = "moodle_mobile_app") -> bool:
         """Connect to the LMS using Moodle REST client"""
@@ -828,16 +949,16 @@ class LMS(ILMS):
             from moodle_rest import MoodleRestClient
             
             # Store credentials
-            self._username = username
-            self._password = password
-            self._service = service
+            self.username = username
+            self.password = password
+            self.service = service
             
             # Create Moodle REST client
             self.moodle_client = MoodleRestClient(self._host, username, password, service)
             
             # Connect to Moodle
             if self.moodle_client.connect():
-                self._token = self.moodle_client.token
+                self.token = self.moodle_client.token
                 
                 # Load data from Moodle
                 self.load_lms_data()
@@ -845,197 +966,310 @@ class LMS(ILMS):
             else:
                 return False
                 
-        except Exception as e:
-            print(f"Connection error: {e}")
+        except Exception:
+            logger.exception("Connection error")
             return False
     
     def is_connected(self) -> bool:
-        return self._token != ""
+        return self.token != ""
     
     def add_category(self, category: ICategory):
         """Add a category to the LMS"""
         category.set_lms(self)
-        self._categories.append(category)
+        self.categories.append(category)
+        self._categories_by_id[category.get_id()] = category
     
     def remove_category(self, category: ICategory):
         """Remove a category from the LMS"""
-        if category in self._categories:
-            self._categories.remove(category)
-            category.set_lms(None)
+        try:
+            self.categories.remove(category)
+        except ValueError:
+            return
+        if self._categories_by_id.get(category.get_id()) is category:
+            del self._categories_by_id[category.get_id()]
+        category.set_lms(None)
     
     def add_course(self, course: ICourse):
         """Add a course to the LMS"""
         course.set_lms(self)
         self._courses.append(course)
+        self._courses_by_id[course.get_id()] = course
+    
+    def add_courses(self, courses: List[ICourse]):
+        """Add several courses to the LMS at once"""
+        courses_by_id = self._courses_by_id
+        for course in courses:
+            course.set_lms(self)
+            courses_by_id[course.get_id()] = course
+        self._courses.extend(courses)
     
     def remove_course(self, course: ICourse):
         """Remove a course from the LMS"""
-        if course in self._courses:
+        try:
             self._courses.remove(course)
-            course.set_lms(None)
+        except ValueError:
+            return
+        if self._courses_by_id.get(course.get_id()) is course:
+            del self._courses_by_id[course.get_id()]
+        course.set_lms(None)
     
     def add_enrolled_course(self, course: ICourse):
         """Add an enrolled course to the LMS"""
         course.set_lms(self)
-        self._enrolled_courses.append(course)
+        self.enrolled_courses.append(course)
     
     def remove_enrolled_course(self, course: ICourse):
         """Remove an enrolled course from the LMS"""
-        if course in self._enrolled_courses:
-            self._enrolled_courses.remove(course)
-            course.set_lms(None)
+        try:
+            self.enrolled_courses.remove(course)
+        except ValueError:
+            return
+        course.set_lms(None)
     
     def get_flat_courses(self) -> List[ICourse]:
-        return self._flat_courses
+        return self.flat_courses
     
     def set_flat_courses(self, courses: List[ICourse]):
-        self._flat_courses = courses
+        self.flat_courses = courses
     
     def get_auto_connect(self) -> bool:
-        return self._auto_connect
+        return self.auto_connect
     
     def set_auto_connect(self, value: bool):
-        self._auto_connect = value
+        self.auto_connect = value
     
     def get_id(self) -> str:
-        return self._id
+        return self.id
     
     def set_id(self, value: str):
-        self._id = value
+        self.id = value
     
     def get_password(self) -> str:
-        return self._password
+        return self.password
     
     def set_password(self, value: str):
-        self._password = value
+        self.password = value
     
     def get_service(self) -> str:
-        return self._service
+        return self.service
     
     def set_service(self, value: str):
-        self._service = value
+        self.service = value
     
     def get_username(self) -> str:
-        return self._username
+        return self.username
     
     def set_username(self, value: str):
-        self._username = value
+        self.username = value
     
     def first_level_categories_count(self) -> int:
         """Get count of first level categories"""
-        return len(self._categories)
+        return len(self.categories)
     
     def load_lms_data(self):
         """Load all LMS data (categories, courses, etc.) from Moodle"""
         try:
+            # Keep the previous objects by id so a refresh updates them in place;
+            # tree items bound to a category or course stay valid
+            previous_categories = self._categories_by_id
+            previous_courses = self._courses_by_id
+            previous_enrolled = {course.get_id(): course for course in self.enrolled_courses}
+            
             # Clear existing data
-            self._categories.clear()
+            self.categories.clear()
             self._courses.clear()
-            self._enrolled_courses.clear()
+            self._categories_by_id = {}
+            self._courses_by_id = {}
+            self._unbuilt_courses.clear()
+            self.enrolled_courses.clear()
+            
+            # The three Moodle requests are independent, so overlap their network
+            # latency; building and linking the models stays on this thread
+            client = self.moodle_client
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                categories_future = executor.submit(client.get_categories)
+                courses_future = executor.submit(client.get_courses)
+                enrolled_future = executor.submit(self._fetch_enrolled_courses_data)
             
             # Load categories
-            self.load_categories()
+            self.load_categories(self._prefetched(categories_future, "categories"),
+                                 previous_categories)
             
             # Load courses
-            self.load_courses()
+            self.load_courses(self._prefetched(courses_future, "courses"), previous_courses)
             
             # Load enrolled courses
-            self.load_enrolled_courses()
+            self.load_enrolled_courses(self._prefetched(enrolled_future, "enrolled courses"),
+                                       previous_enrolled)
             
-            print(f"Loaded {len(self._categories)} categories, {len(self._courses)} courses, {len(self._enrolled_courses)} enrolled courses")
+            logger.info("Loaded %d categories, %d courses, %d enrolled courses",
+                        len(self.categories), len(self._courses), len(self.enrolled_courses))
             
-        except Exception as e:
-            print(f"Error loading LMS data: {e}")
+        except Exception:
+            logger.exception("Error loading LMS data")
     
-    def load_categories(self):
-        """Load categories from Moodle"""
+    @staticmethod
+    def _prefetched(future, what: str):
+        """Return a prefetched Moodle response, or None if the request failed"""
         try:
-            categories_data = self.moodle_client.get_categories()
+            return future.result()
+        except Exception:
+            logger.exception("Error loading %s", what)
+            return None
+    
+    def load_categories(self, categories_data=_UNSET,
+                        previous: Optional[Dict[int, ICategory]] = None):
+        """Load categories from Moodle, reusing categories from a previous load by id"""
+        try:
+            if categories_data is _UNSET:
+                categories_data = self.moodle_client.get_categories()
             if categories_data:
+                # Bind the hot lookups once; large sites return thousands of rows
+                categories_append = self.categories.append
+                categories_by_id = self._categories_by_id
+                get_previous = previous.get if previous else None
                 for cat_data in categories_data:
-                    category = Category(
-                        category_id=cat_data.get('id', 0),
-                        name=cat_data.get('name', f"Category {cat_data.get('id', 0)}")
-                    )
-                    category.set_lms(self)
-                    self._categories.append(category)
-        except Exception as e:
-            print(f"Error loading categories: {e}")
+                    get = cat_data.get
+                    cat_id = get('id', 0)
+                    name = get('name')
+                    if name is None:
+                        name = f"Category {cat_id}"
+                    category = get_previous(cat_id) if get_previous else None
+                    if category is None:
+                        category = Category(category_id=cat_id, name=name)
+                        category.lms = self
+                    else:
+                        if category.get_name() != name:
+                            category.set_name(name)
+                        # load_courses attaches this category's courses again
+                        category.courses.clear()
+                    categories_append(category)
+                    categories_by_id[cat_id] = category
+        except Exception:
+            logger.exception("Error loading categories")
+    
+    def _course_from_row(self, course_data: dict,
+                         previous: Optional[Dict[int, ICourse]] = None) -> ICourse:
+        """Build a Course from a raw Moodle course row"""
+        return self._new_course(course_data.get('id', 0), course_data.get('fullname'), previous)
+    
+    def _new_course(self, course_id: int, name: Optional[str],
+                    previous: Optional[Dict[int, ICourse]] = None) -> ICourse:
+        """Build a Course belonging to this LMS, or update one from a previous load"""
+        if name is None:
+            name = f"Course {course_id}"
+        if previous:
+            course = previous.get(course_id)
+            if course is not None:
+                if course.get_name() != name:
+                    course.set_name(name)
+                return course
+        course = Course(course_id=course_id, name=name)
+        course.lms = self
+        return course
     
-    def load_courses(self):
-        """Load courses from Moodle"""
+    def load_courses(self, courses_data=_UNSET, previous: Optional[Dict[int, ICourse]] = None):
+        """Load courses from Moodle, reusing courses from a previous load by id"""
         try:
-            courses_data = self.moodle_client.get_courses()
+            if courses_data is _UNSET:
+                courses_data = self.moodle_client.get_courses()
             if courses_data:
+                get_category = self._categories_by_id.get
+                courses_by_id = self._courses_by_id
+                unbuilt_courses = self._unbuilt_courses
+                new_course = self._new_course
+                # Group built courses per category and attach each group with one extend
+                grouped: Dict[int, List[Course]] = {}
+                uncategorized: List[Course] = []
                 for course_data in courses_data:
-                    course = Course(
-                        course_id=course_data.get('id', 0),
-                        name=course_data.get('fullname', f"Course {course_data.get('id', 0)}")
-                    )
-                    course.set_lms(self)
+                    course_id = course_data.get('id', 0)
                     
-                    # Set category if available
+                    # Only build the courses the category tree shows; rows whose
+                    # category is unknown are kept as id/name until get_course_by_id asks
                     category_id = course_data.get('categoryid', 0)
                     if category_id > 0:
-                        category = self.get_category_by_id(category_id)
-                        if category:
-                            course.set_category(category)
-                            category.add_course(course)
+                        category = get_category(category_id)
+                        if not category:
+                            if previous and course_id in previous:
+                                # Already built by an earlier lookup; keep it indexed
+                                courses_by_id[course_id] = new_course(
+                                    course_id, course_data.get('fullname'), previous)
+                            else:
+                                unbuilt_courses[course_id] = course_data.get('fullname')
+                        else:
+                            course = new_course(course_id, course_data.get('fullname'), previous)
+                            course.category = category
+                            group = grouped.get(category_id)
+                            if group is None:
+                                group = grouped[category_id] = []
+                            group.append(course)
+                            courses_by_id[course_id] = course
                     else:
                         # Course without category
-                        self._courses.append(course)
-        except Exception as e:
-            print(f"Error loading courses: {e}")
+                        course = new_course(course_id, course_data.get('fullname'), previous)
+                        course.category = None
+                        uncategorized.append(course)
+                        courses_by_id[course_id] = course
+                
+                for category_id, group in grouped.items():
+                    get_category(category_id).courses.extend(group)
+                self._courses.extend(uncategorized)
+        except Exception:
+            logger.exception("Error loading courses")
+    
+    def _fetch_enrolled_courses_data(self) -> Optional[List[dict]]:
+        """Fetch the raw enrolled course rows for the current user"""
+        # Get user info first
+        user_data = self.moodle_client.get_user_by_field('username', self.username)
+        if user_data:
+            user_id = user_data.get('id', 0)
+            if user_id > 0:
+                # Get enrolled courses using core_enrol_get_users_courses
+                return self.moodle_client.get_users_courses(user_id)
+        return None
     
-    def load_enrolled_courses(self):
+    def load_enrolled_courses(self, enrolled_data=_UNSET,
+                              previous: Optional[Dict[int, ICourse]] = None):
         """Load enrolled courses for the current user"""
         try:
-            # Get user info first
-            user_data = self.moodle_client.get_user_by_field('username', self._username)
-            if user_data:
-                user_id = user_data.get('id', 0)
-                if user_id > 0:
-                    # Get enrolled courses using core_enrol_get_users_courses
-                    enrolled_data = self.moodle_client.get_users_courses(user_id)
-                    if enrolled_data:
-                        for enrolled_course in enrolled_data:
-                            course = Course(
-                                course_id=enrolled_course.get('id', 0),
-                                name=enrolled_course.get('fullname', f"Course {enrolled_course.get('id', 0)}")
-                            )
-                            course.set_lms(self)
-                            self._enrolled_courses.append(course)
-        except Exception as e:
-            print(f"Error loading enrolled courses: {e}")
+            if enrolled_data is _UNSET:
+                enrolled_data = self._fetch_enrolled_courses_data()
+            if enrolled_data:
+                for enrolled_course in enrolled_data:
+                    # Reuse the course already loaded for the site if there is one
+                    course = self.get_course_by_id(enrolled_course.get('id', 0))
+                    if course is None:
+                        course = self._course_from_row(enrolled_course, previous)
+                    self.enrolled_courses.append(course)
+        except Exception:
+            logger.exception("Error loading enrolled courses")
     
     def get_categories_from_connection(self):
         """Get categories from LMS connection (legacy method)"""
         self.load_categories()
-        return self._categories
+        return self.categories
     
     def get_category_by_id(self, category_id: int) -> Optional[ICategory]:
         """Get category by ID"""
-        for category in self._categories:
-            if category.get_id() == category_id:
-                return category
-        return None
+        return self._categories_by_id.get(category_id)
     
     def get_course_by_id(self, course_id: int) -> Optional[ICourse]:
         """Get course by ID"""
-        for course in self._courses:
-            if course.get_id() == course_id:
-                return course
-        return None
-    
-    def get_courses(self):
-        """Get courses from LMS"""
+        course = self._courses_by_id.get(course_id)
+        if course is None and course_id in self._unbuilt_courses:
+            course = self._new_course(course_id, self._unbuilt_courses.pop(course_id))
+            self._courses_by_id[course_id] = course
+        return course
+    
+    def fetch_courses(self):
+        """Load courses from the LMS"""
         self.load_courses()
         return self._courses
     
     def get_users_by_almost_all_fields(self, filter_str: str) -> List[IUser]:
         """Get users by almost all fields"""
         if not self.is_connected():
-            print("LMS not connected")
+            logger.warning("LMS not connected")
             return []
         
         try:
@@ -1064,39 +1298,22 @@ class LMS(ILMS):
             users_data = rest_client.get_users(criteria)
             
             if users_data:
-                users = []
-                for user_data in users_data:
-                    user = User(
-                        user_id=user_data.get('id', 0),
-                        first_name=user_data.get('firstname', ''),
-                        last_name=user_data.get('lastname', ''),
-                        email=user_data.get('email', '')
-                    )
-                    user.set_full_name(user_data.get('fullname', ''))
-                    user.set_username(user_data.get('username', ''))
-                    user.set_lms(self)
-                    
-                    # Set user roles if available
-                    if 'roles' in user_data:
-                        roles = [role.get('name', '') for role in user_data['roles']]
-                        user.set_roles(roles)
-                    
-                    users.append(user)
+                users = [User.from_moodle(user_data, lms=self) for user_data in users_data]
                 
-                print(f"Found {len(users)} users matching '{filter_str}'")
+                logger.info("Found %d users matching '%s'", len(users), filter_str)
                 return users
             else:
-                print(f"No users found matching '{filter_str}'")
+                logger.info("No users found matching '%s'", filter_str)
                 return []
                 
-        except Exception as e:
-            print(f"Error searching users: {e}")
+        except Exception:
+            logger.exception("Error searching users")
             return []
     
     def download_all_course_content(self, course: ICourse):
         """Download all course content"""
         if not self.is_connected():
-            print("LMS not connected")
+            logger.warning("LMS not connected")
             return
         
         try:
@@ -1116,7 +1333,7 @@ class LMS(ILMS):
             download_dir = f"downloads/{course.get_name()}"
             os.makedirs(download_dir, exist_ok=True)
             
-            print(f"Downloading course content to: {download_dir}")
+            logger.info("Downloading course content to: %s", download_dir)
             
             # Get course content
             course_content = course.get_course_content()
@@ -1137,39 +1354,37 @@ class LMS(ILMS):
                             file_name = content.get_file_name() or f"file_{downloaded_files}"
                             file_path = os.path.join(module_dir, file_name)
                             
-                            print(f"Downloading: {file_name}")
+                            logger.info("Downloading: %s", file_name)
                             
                             if rest_client.download_file(content.get_file_url(), file_path):
                                 downloaded_files += 1
                             else:
-                                print(f"Failed to download: {file_name}")
+                                logger.warning("Failed to download: %s", file_name)
             
-            print(f"Downloaded {downloaded_files} files for course '{course.get_name()}'")
+            logger.info("Downloaded %d files for course '%s'", downloaded_files, course.get_name())
             
-        except Exception as e:
-            print(f"Error downloading course content: {e}")
+        except Exception:
+            logger.exception("Error downloading course content")
     
-    # Properties required by ILMS interface
-    categories = property(get_categories)
+    # Properties required by ILMS interface; categories, enrolled_courses,
+    # token and user are plain slot attributes
     courses = property(get_courses)
-    enrolled_courses = property(get_enrolled_courses)
-    filter_content = property(get_filter_content)
     host = property(get_host, set_host)
     name = property(get_name, set_name)
-    token = property(get_token, set_token)
-    user = property(get_user)
 
 
-class Content(IContent):
+class Content(_CachedFilterContent, IContent):
     """Concrete implementation of content file"""
     
+    __slots__ = ('_file_name', '_file_type', 'mime_type', 'file_url', 'module')
+    
     def __init__(self, module: Optional['IModule'] = None):
         self._file_name = ""
         self._file_type = ""
-        self._mime_type = ""
-        self._file_url = ""
-        self._module = module
-        self._filter_content = ""
+        self.mime_type = ""
+        self.file_url = ""
+        self.module = module
+        self._fc = self._fcl = _UNSET
     
     def get_file_name(self) -> str:
         return self._file_name
@@ -1178,48 +1393,44 @@ class Content(IContent):
         return self._file_type
     
     def get_mime_type(self) -> str:
-        return self._mime_type
+        return self.mime_type
     
     def get_file_url(self) -> str:
-        return self._file_url
+        return self.file_url
     
     def get_module(self) -> Optional['IModule']:
-        return self._module
+        return self.module
     
-    def get_filter_content(self) -> str:
-        if not self._filter_content:
-            self._filter_content = f"{self._file_name} {self._file_type}"
-        return self._filter_content
+    def _build_filter_content(self) -> str:
+        return f"{self._file_name} {self._file_type}"
     
     def set_file_name(self, value: str):
         self._file_name = value
-        self._filter_content = ""  # Reset filter content
+        self._invalidate_filter()
     
     def set_file_type(self, value: str):
-        self._file_type = value
-        self._filter_content = ""  # Reset filter content
+        self._file_type = sys.intern(value)
+        self._invalidate_filter()
     
     def set_mime_type(self, value: str):
-        self._mime_type = value
+        self.mime_type = sys.intern(value)
     
     def set_file_url(self, value: str):
-        self._file_url = value
+        self.file_url = value
     
     def set_module(self, value: Optional['IModule']):
-        self._module = value
+        self.module = value
     
-    # Properties
+    # Properties; mime_type, file_url and module are plain slot attributes
     file_name = property(get_file_name, set_file_name)
     file_type = property(get_file_type, set_file_type)
-    mime_type = property(get_mime_type, set_mime_type)
-    file_url = property(get_file_url, set_file_url)
-    module = property(get_module, set_module)
-    filter_content = property(get_filter_content)
 
 
 class LMSNetwork:
     """Network class for managing multiple LMS instances"""
     
+    __slots__ = ('_lms_list',)
+    
     def __init__(self):
         self._lms_list: List[ILMS] = []
     
@@ -1233,45 +1444,51 @@ class LMSNetwork:
     
     def get_lms(self, index: int) -> Optional[ILMS]:
         """Get an LMS instance by index"""
-        if 0 <= index < len(self._lms_list):
-            return self._lms_list[index]
+        # Negative indices are rejected rather than counted from the end
+        if index >= 0:
+            try:
+                return self._lms_list[index]
+            except IndexError:
+                pass
         return None
     
     def remove(self, index: int):
         """Remove an LMS instance by index"""
-        if 0 <= index < len(self._lms_list):
-            self._lms_list.pop(index)
+        if index >= 0:
+            try:
+                del self._lms_list[index]
+            except IndexError:
+                pass
     
     def clear(self):
         """Clear all LMS instances from the network"""
         self._lms_list.clear()
     
-    def get_all_lms(self) -> List[ILMS]:
+    def get_all_lms(self) -> Tuple[ILMS, ...]:
         """Get all LMS instances in the network"""
-        return self._lms_list.copy()
+        return tuple(self._lms_list)
     
     # Allow indexing access
-    def __getitem__(self, index: int) -> Optional[ILMS]:
-        return self.get_lms(index)
+    __getitem__ = get_lms
     
     def __setitem__(self, index: int, value: ILMS):
-        if 0 <= index < len(self._lms_list):
-            self._lms_list[index] = value
+        if index >= 0:
+            try:
+                self._lms_list[index] = value
+            except IndexError:
+                pass
     
     def __len__(self) -> int:
-        return self.count()
+        return len(self._lms_list)
     
     def __iter__(self):
         return iter(self._lms_list)
 
 
 # Global network instance
-_global_lms_network: Optional[LMSNetwork] = None
+_global_lms_network: LMSNetwork = LMSNetwork()
 
 
 def get_global_network() -> LMSNetwork:
     """Get the global LMS network instance"""
-    global _global_lms_network
-    if _global_lms_network is None:
-        _global_lms_network = LMSNetwork()
     return _global_lms_network
@@ -9,6 +9,12 @@ from PyQt5.QtCore import Qt
 class AboutDialog(QDialog):
     """About dialog for LMS Explorer"""
     
+    DESCRIPTION = (
+        "A Learning Management System interface for Moodle.\n\n"
+        "This application provides a user-friendly interface to browse and\n"
+        "manage Moodle courses, users, and content."
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -35,11 +41,7 @@ class AboutDialog(QDialog):
         layout.addWidget(version_label)
         
         # Description
-        description = QLabel(
-            "A Learning Management System interface for Moodle.\n\n"
-            "This application provides a user-friendly interface to browse and\n"
-            "manage Moodle courses, users, and content."
-        )
+        description = QLabel(self.DESCRIPTION)
         description.setAlignment(Qt.AlignCenter)
         description.setWordWrap(True)
         layout.addWidget(description)
@@ -4,10 +4,121 @@ Dialog to display course content (sections, modules, and files)
 """
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QTreeWidget, QTreeWidgetItem, 
-                             QSplitter, QTextEdit, QMessageBox)
-from PyQt5.QtCore import Qt
+                             QPushButton, QTreeView, QHeaderView, 
+                             QSplitter, QTextEdit, QMessageBox, QWidget)
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex
 from lms_interface import ICourse, ISection, IModule, IContent
+from helpers.utils import Utils
+
+
+class CourseContentModel(QAbstractItemModel):
+    """Tree model over a course's sections, modules and content files, built on demand"""
+    
+    HEADERS = ("Section", "Module", "Content")
+    
+    def __init__(self, course: ICourse, parent=None):
+        super().__init__(parent)
+        self.course = course
+        self._sections = []
+        # Per-node bookkeeping keyed by id(node); the node lists keep the objects alive
+        self._children = {}
+        self._parents = {}
+        self._rows = {}
+        self._depths = {}
+    
+    def reload(self):
+        """Re-read the course content and reset the model"""
+        self.beginResetModel()
+        self._children.clear()
+        self._parents.clear()
+        self._rows.clear()
+        self._depths.clear()
+        self._sections = list(self.course.get_course_content() or [])
+        self._register(self._sections, None, 0)
+        self.endResetModel()
+    
+    def _register(self, nodes, parent_node, depth: int):
+        for row, node in enumerate(nodes):
+            key = id(node)
+            self._parents[key] = parent_node
+            self._rows[key] = row
+            self._depths[key] = depth
+    
+    def _child_nodes(self, node) -> list:
+        if node is None:
+            return self._sections
+        key = id(node)
+        children = self._children.get(key)
+        if children is None:
+            depth = self._depths[key]
+            if depth == 0:
+                children = list(node.get_modules())
+            elif depth == 1:
+                children = list(node.get_contents())
+            else:
+                children = []
+            self._register(children, node, depth + 1)
+            self._children[key] = children
+        return children
+    
+    def node(self, index: QModelIndex):
+        """Return the section, module or content object behind an index"""
+        return index.internalPointer() if index.isValid() else None
+    
+    def depth(self, index: QModelIndex) -> int:
+        """Return 0 for a section, 1 for a module and 2 for a content item"""
+        return self._depths[id(index.internalPointer())]
+    
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        children = self._child_nodes(self.node(parent))
+        return self.createIndex(row, column, children[row])
+    
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent_node = self._parents.get(id(index.internalPointer()))
+        if parent_node is None:
+            return QModelIndex()
+        return self.createIndex(self._rows[id(parent_node)], 0, parent_node)
+    
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._sections)
+        key = id(parent.internalPointer())
+        if self._depths[key] >= 2:
+            return False
+        # Report sections and modules as expandable without listing their children
+        children = self._children.get(key)
+        return children is None or bool(children)
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self._child_nodes(self.node(parent)))
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        node = index.internalPointer()
+        depth = self._depths[id(node)]
+        # Each level shows its text in its own column
+        if index.column() != depth:
+            return None
+        if depth == 0:
+            return node.name or f"Section {node.id}"
+        if depth == 1:
+            return node.name or f"Module {node.id}"
+        return node.get_file_name() or "File"
+    
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
 
 
 class CourseContentDialog(QDialog):
@@ -17,6 +128,11 @@ class CourseContentDialog(QDialog):
         super().__init__(parent)
         
         self.course = course
+        # Detail panel (title, text) per clicked object, keyed by id(obj); reset on reload
+        self._details_cache = {}
+        # Detail handlers indexed by tree level: section, module, content
+        self._detail_handlers = (self.show_section_details, self.show_module_details,
+                                 self.show_content_details)
         self.setWindowTitle(f"Course Content - {course.fullname or course.shortname}")
         self.setModal(True)
         self.setMinimumWidth(800)
@@ -39,9 +155,15 @@ class CourseContentDialog(QDialog):
         layout.addWidget(splitter)
         
         # Left side - Content tree
-        self.content_tree = QTreeWidget()
-        self.content_tree.setHeaderLabels(["Section", "Module", "Content"])
-        self.content_tree.itemClicked.connect(self.on_item_clicked)
+        self.content_model = CourseContentModel(self.course, self)
+        self.content_tree = QTreeView()
+        self.content_tree.setModel(self.content_model)
+        # Fixed starting widths; measuring every row to fit contents is O(rows)
+        header = self.content_tree.header()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate((200, 220, 220)):
+            header.resizeSection(column, width)
+        self.content_tree.clicked.connect(self.on_item_clicked)
         splitter.addWidget(self.content_tree)
         
         # Right side - Details
@@ -55,6 +177,8 @@ class CourseContentDialog(QDialog):
         # Details text
         self.details_text = QTextEdit()
         self.details_text.setReadOnly(True)
+        self.details_text.setAcceptRichText(False)
+        self.details_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
         right_widget.addWidget(self.details_text)
         
         # Add right widget to splitter
@@ -81,103 +205,96 @@ class CourseContentDialog(QDialog):
         
     def load_content(self):
         """Load course content"""
-        self.content_tree.clear()
+        self._details_cache.clear()
         self.details_text.clear()
         self.details_label.setText("Select an item to view details")
         
+        # Hold repaints until the reset and the section expansion are both done
+        self.content_tree.setUpdatesEnabled(False)
         try:
-            # Get course content
-            content = self.course.get_course_content()
+            # Rebuild the model; rows are created lazily as the view asks for them
+            self.content_model.reload()
             
-            if not content:
+            if not self.content_model.hasChildren():
                 self.details_label.setText("No content found")
                 self.details_text.setText("This course has no content available.")
                 return
             
-            # Add sections to tree
-            for section in content:
-                section_item = QTreeWidgetItem(self.content_tree)
-                section_item.setText(0, section.name or f"Section {section.id}")
-                section_item.setText(1, "")
-                section_item.setText(2, "")
-                
-                # Store section data
-                section_item.setData(0, Qt.UserRole, section)
-                
-                # Add modules to section
-                for module in section.get_modules():
-                    module_item = QTreeWidgetItem(section_item)
-                    module_item.setText(0, "")
-                    module_item.setText(1, module.name or f"Module {module.id}")
-                    module_item.setText(2, "")
-                    
-                    # Store module data
-                    module_item.setData(0, Qt.UserRole, module)
-                    
-                    # Add content to module
-                    for content_item in module.get_contents():
-                        content_item_tree = QTreeWidgetItem(module_item)
-                        content_item_tree.setText(0, "")
-                        content_item_tree.setText(1, "")
-                        content_item_tree.setText(2, content_item.get_file_name() or "File")
-                        
-                        # Store content data
-                        content_item_tree.setData(0, Qt.UserRole, content_item)
-            
-            # Expand all sections
-            self.content_tree.expandAll()
-            
-            # Resize columns
-            self.content_tree.header().resizeSections(QTreeWidget.ResizeToContents)
+            # Expand the sections only; a module's files are listed by the model
+            # the first time the user expands that module
+            self.content_tree.expandToDepth(0)
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load course content: {str(e)}")
+        finally:
+            self.content_tree.setUpdatesEnabled(True)
             
-    def on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def on_item_clicked(self, index: QModelIndex):
         """Handle item click in the content tree"""
-        data = item.data(0, Qt.UserRole)
+        data = self.content_model.node(index)
         
         if not data:
             return
             
-        if isinstance(data, ISection):
-            self.show_section_details(data)
-        elif isinstance(data, IModule):
-            self.show_module_details(data)
-        elif isinstance(data, IContent):
-            self.show_content_details(data)
+        # The model knows each node's level, so dispatch on it instead of isinstance
+        self._detail_handlers[self.content_model.depth(index)](data)
             
+    def _show_details(self, obj, build):
+        """Show an object's details, building the text once per load"""
+        details = self._details_cache.get(id(obj))
+        if details is None:
+            details = self._details_cache[id(obj)] = build(obj)
+        title, details_html = details
+        self.details_label.setText(title)
+        self.details_text.setHtml(details_html)
+        
     def show_section_details(self, section: ISection):
         """Show section details"""
-        self.details_label.setText(f"Section: {section.name or f'Section {section.id}'}")
-        
-        details = f"Section ID: {section.id}\n"
-        details += f"Name: {section.name or 'N/A'}\n"
-        details += f"Course: {section.get_course().fullname if section.get_course() else 'N/A'}\n"
-        details += f"Number of Modules: {len(section.get_modules())}\n"
-        
-        self.details_text.setText(details)
+        self._show_details(section, self._section_details)
         
     def show_module_details(self, module: IModule):
         """Show module details"""
-        self.details_label.setText(f"Module: {module.name or f'Module {module.id}'}")
-        
-        details = f"Module ID: {module.id}\n"
-        details += f"Name: {module.name or 'N/A'}\n"
-        details += f"Type: {module.mod_name or 'N/A'}\n"
-        details += f"Section: {module.get_section().name if module.get_section() else 'N/A'}\n"
-        details += f"Number of Content Items: {len(module.get_contents())}\n"
-        
-        self.details_text.setText(details)
+        self._show_details(module, self._module_details)
         
     def show_content_details(self, content: IContent):
         """Show content details"""
-        self.details_label.setText(f"Content: {content.get_file_name() or 'File'}")
+        self._show_details(content, self._content_details)
+        
+    def _section_details(self, section: ISection):
+        """Build the title and text shown for a section"""
+        course = section.get_course()
+        details = [
+            ("Section ID", section.id),
+            ("Name", section.name or 'N/A'),
+            ("Course", course.fullname if course else 'N/A'),
+            ("Number of Modules", len(section.get_modules())),
+        ]
+        
+        return f"Section: {section.name or f'Section {section.id}'}", Utils.details_html(details)
+        
+    def _module_details(self, module: IModule):
+        """Build the title and text shown for a module"""
+        section = module.get_section()
+        details = [
+            ("Module ID", module.id),
+            ("Name", module.name or 'N/A'),
+            ("Type", module.mod_name or 'N/A'),
+            ("Section", section.name if section else 'N/A'),
+            ("Number of Content Items", len(module.get_contents())),
+        ]
+        
+        return f"Module: {module.name or f'Module {module.id}'}", Utils.details_html(details)
         
-        details = f"File Name: {content.get_file_name() or 'N/A'}\n"
-        details += f"File Type: {content.get_file_type() or 'N/A'}\n"
-        details += f"MIME Type: {content.get_mime_type() or 'N/A'}\n"
-        details += f"File URL: {content.get_file_url() or 'N/A'}\n"
-        details += f"Module: {content.get_module().name if content.get_module() else 'N/A'}\n"
+    def _content_details(self, content: IContent):
+        """Build the title and text shown for a content file"""
+        file_name = content.get_file_name()
+        module = content.get_module()
+        details = [
+            ("File Name", file_name or 'N/A'),
+            ("File Type", content.get_file_type() or 'N/A'),
+            ("MIME Type", content.get_mime_type() or 'N/A'),
+            ("File URL", content.get_file_url() or 'N/A'),
+            ("Module", module.name if module else 'N/A'),
+        ]
         
-        self.details_text.setText(details)
+        return f"Content: {file_name or 'File'}", Utils.details_html(details)
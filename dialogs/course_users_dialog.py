@@ -4,10 +4,82 @@ Dialog to display course users and their information
 """
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QTreeWidget, QTreeWidgetItem, 
-                             QSplitter, QTextEdit, QMessageBox, QComboBox)
-from PyQt5.QtCore import Qt
+                             QPushButton, QTreeView, 
+                             QSplitter, QTextEdit, QMessageBox, QComboBox, QHeaderView,
+                             QWidget)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 from lms_interface import ICourse, IUser
+from helpers.utils import Utils
+
+
+ALL_USERS = "All Users"
+
+
+class CourseUsersModel(QAbstractTableModel):
+    """Table model over a course's enrolled users"""
+    
+    HEADERS = ("Name", "Username", "Email", "Roles")
+    
+    def __init__(self, roles_of, parent=None):
+        super().__init__(parent)
+        self._users = []
+        self._roles_of = roles_of
+    
+    def set_users(self, users):
+        """Replace the listed users"""
+        self.beginResetModel()
+        self._users = list(users)
+        self.endResetModel()
+    
+    def user(self, row: int) -> IUser:
+        return self._users[row]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._users)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        user = self._users[index.row()]
+        column = index.column()
+        if column == 0:
+            return user.fullname or f"{user.first_name} {user.last_name}"
+        if column == 1:
+            return user.username or ""
+        if column == 2:
+            return user.email or ""
+        user_roles = self._roles_of(user)
+        return ", ".join(user_roles) if user_roles else "Student"
+    
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
+class RoleFilterProxyModel(QSortFilterProxyModel):
+    """Shows only the users holding the selected role"""
+    
+    def __init__(self, roles_of, parent=None):
+        super().__init__(parent)
+        self._roles_of = roles_of
+        self._role = ""
+    
+    def set_role(self, role: str):
+        """Filter on a role name; "All Users" or an empty name shows everyone"""
+        role = "" if role == ALL_USERS else role
+        if role != self._role:
+            self._role = role
+            self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        role = self._role
+        if not role:
+            return True
+        return role in self._roles_of(self.sourceModel().user(source_row))
 
 
 class CourseUsersDialog(QDialog):
@@ -17,6 +89,10 @@ class CourseUsersDialog(QDialog):
         super().__init__(parent)
         
         self.course = course
+        # Roles per user (keyed by id(user)), read once per load_users
+        self._roles_cache = {}
+        # Detail panel (title, text) per clicked user, keyed by id(user); reset on reload
+        self._details_cache = {}
         self.setWindowTitle(f"Course Users - {course.fullname or course.shortname}")
         self.setModal(True)
         self.setMinimumWidth(900)
@@ -39,7 +115,7 @@ class CourseUsersDialog(QDialog):
         
         filter_layout.addWidget(QLabel("Filter by Role:"))
         self.role_filter = QComboBox()
-        self.role_filter.addItem("All Users")
+        self.role_filter.addItem(ALL_USERS)
         self.role_filter.currentTextChanged.connect(self.on_role_filter_changed)
         filter_layout.addWidget(self.role_filter)
         
@@ -50,10 +126,19 @@ class CourseUsersDialog(QDialog):
         splitter = QSplitter(Qt.Horizontal)
         layout.addWidget(splitter)
         
-        # Left side - Users tree
-        self.users_tree = QTreeWidget()
-        self.users_tree.setHeaderLabels(["Name", "Username", "Email", "Roles"])
-        self.users_tree.itemClicked.connect(self.on_item_clicked)
+        # Left side - Users tree; role filtering is done by the proxy model
+        self.users_model = CourseUsersModel(self._user_roles, self)
+        self.users_proxy = RoleFilterProxyModel(self._user_roles, self)
+        self.users_proxy.setSourceModel(self.users_model)
+        self.users_tree = QTreeView()
+        self.users_tree.setRootIsDecorated(False)
+        self.users_tree.setModel(self.users_proxy)
+        # Fixed starting widths; measuring every row to fit contents is O(rows)
+        header = self.users_tree.header()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for column, width in enumerate((180, 120, 200, 140)):
+            header.resizeSection(column, width)
+        self.users_tree.clicked.connect(self.on_item_clicked)
         splitter.addWidget(self.users_tree)
         
         # Right side - Details
@@ -67,6 +152,8 @@ class CourseUsersDialog(QDialog):
         # Details text
         self.details_text = QTextEdit()
         self.details_text.setReadOnly(True)
+        self.details_text.setAcceptRichText(False)
+        self.details_text.setTextInteractionFlags(Qt.TextSelectableByMouse)
         right_widget.addWidget(self.details_text)
         
         # Add right widget to splitter
@@ -93,10 +180,13 @@ class CourseUsersDialog(QDialog):
         
     def load_users(self):
         """Load course users"""
-        self.users_tree.clear()
+        self.users_model.set_users([])
+        self._details_cache.clear()
         self.details_text.clear()
         self.details_label.setText("Select a user to view details")
         
+        # Hold repaints until the role list and the rows are both in place
+        self.users_tree.setUpdatesEnabled(False)
         try:
             # Get enrolled users
             users = self.course.get_enrolled_users()
@@ -106,94 +196,94 @@ class CourseUsersDialog(QDialog):
                 self.details_text.setText("This course has no enrolled users.")
                 return
             
+            # Read every user's roles once; the table and the filter reuse them
+            self._roles_cache = {
+                id(user): tuple(user.get_roles()) if hasattr(user, 'get_roles') else ()
+                for user in users
+            }
+            
             # Get available roles for filtering
             roles = set()
-            for user in users:
-                if hasattr(user, 'get_roles'):
-                    user_roles = user.get_roles()
-                    if user_roles:
-                        roles.update(user_roles)
+            for user_roles in self._roles_cache.values():
+                roles.update(user_roles)
             
-            # Update role filter combo box
+            # Update role filter combo box without re-filtering on every item change
             current_role = self.role_filter.currentText()
+            self.role_filter.blockSignals(True)
             self.role_filter.clear()
-            self.role_filter.addItem("All Users")
-            for role in sorted(roles):
-                self.role_filter.addItem(role)
+            self.role_filter.addItem(ALL_USERS)
+            self.role_filter.addItems(sorted(roles))
             
             # Restore previous selection if possible
             index = self.role_filter.findText(current_role)
             if index >= 0:
                 self.role_filter.setCurrentIndex(index)
+            self.role_filter.blockSignals(False)
+            # Apply the selected role before the rows arrive, so the model reset
+            # is the only filtering pass and unmatched users never get view rows
+            self.users_proxy.set_role(self.role_filter.currentText())
             
             # Add users to tree
-            for user in users:
-                user_item = QTreeWidgetItem(self.users_tree)
-                user_item.setText(0, user.fullname or f"{user.first_name} {user.last_name}")
-                user_item.setText(1, user.username or "")
-                user_item.setText(2, user.email or "")
-                
-                # Get user roles
-                user_roles = []
-                if hasattr(user, 'get_roles'):
-                    user_roles = user.get_roles()
-                user_item.setText(3, ", ".join(user_roles) if user_roles else "Student")
-                
-                # Store user data
-                user_item.setData(0, Qt.UserRole, user)
-            
-            # Resize columns
-            self.users_tree.header().resizeSections(QTreeWidget.ResizeToContents)
+            self.users_model.set_users(users)
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load course users: {str(e)}")
+        finally:
+            self.role_filter.blockSignals(False)
+            self.users_tree.setUpdatesEnabled(True)
             
     def on_role_filter_changed(self, role_text: str):
         """Handle role filter change"""
-        for i in range(self.users_tree.topLevelItemCount()):
-            item = self.users_tree.topLevelItem(i)
-            user = item.data(0, Qt.UserRole)
-            
-            if user and role_text != "All Users":
-                user_roles = []
-                if hasattr(user, 'get_roles'):
-                    user_roles = user.get_roles()
-                item.setHidden(role_text not in user_roles)
-            else:
-                item.setHidden(False)
+        self.users_proxy.set_role(role_text)
                 
-    def on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def _user_roles(self, user: IUser) -> tuple:
+        """Return the user's roles from the per-load cache"""
+        user_roles = self._roles_cache.get(id(user))
+        if user_roles is None:
+            user_roles = tuple(user.get_roles()) if hasattr(user, 'get_roles') else ()
+            self._roles_cache[id(user)] = user_roles
+        return user_roles
+    
+    def on_item_clicked(self, index: QModelIndex):
         """Handle item click in the users tree"""
-        user = item.data(0, Qt.UserRole)
+        source_index = self.users_proxy.mapToSource(index)
+        user = self.users_model.user(source_index.row()) if source_index.isValid() else None
         
         if user:
             self.show_user_details(user)
             
     def show_user_details(self, user: IUser):
-        """Show user details"""
-        self.details_label.setText(f"User: {user.fullname or f'{user.first_name} {user.last_name}'}")
+        """Show user details, building the text once per load"""
+        details = self._details_cache.get(id(user))
+        if details is None:
+            details = self._details_cache[id(user)] = self._user_details(user)
+        title, details_html = details
+        self.details_label.setText(title)
+        self.details_text.setHtml(details_html)
         
-        details = f"User ID: {user.id}\n"
-        details += f"First Name: {user.first_name or 'N/A'}\n"
-        details += f"Last Name: {user.last_name or 'N/A'}\n"
-        details += f"Full Name: {user.fullname or 'N/A'}\n"
-        details += f"Username: {user.username or 'N/A'}\n"
-        details += f"Email: {user.email or 'N/A'}\n"
+    def _user_details(self, user: IUser):
+        """Build the title and text shown for a user"""
+        details = [
+            ("User ID", user.id),
+            ("First Name", user.first_name or 'N/A'),
+            ("Last Name", user.last_name or 'N/A'),
+            ("Full Name", user.fullname or 'N/A'),
+            ("Username", user.username or 'N/A'),
+            ("Email", user.email or 'N/A'),
+        ]
         
         # Get user roles
-        user_roles = []
-        if hasattr(user, 'get_roles'):
-            user_roles = user.get_roles()
-        details += f"Roles: {', '.join(user_roles) if user_roles else 'Student'}\n"
+        user_roles = self._user_roles(user)
+        details.append(("Roles", ', '.join(user_roles) if user_roles else 'Student'))
         
         # Get course info
         course = user.get_course()
         if course:
-            details += f"Course: {course.fullname or course.shortname}\n"
+            details.append(("Course", course.fullname or course.shortname))
         
         # Get LMS info
         lms = user.get_lms()
         if lms:
-            details += f"LMS: {lms.get_name() or 'N/A'}\n"
+            details.append(("LMS", lms.get_name() or 'N/A'))
         
-        self.details_text.setText(details)
+        return f"User: {user.fullname or f'{user.first_name} {user.last_name}'}", Utils.details_html(details)
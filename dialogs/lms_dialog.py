@@ -5,7 +5,37 @@ Dialog for connecting to LMS instances
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
                              QPushButton, QComboBox, QCheckBox, QMessageBox)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from moodle_rest import get_shared_session
+
+
+class ConnectionTestSignals(QObject):
+    """Signals emitted by ConnectionTestTask"""
+    
+    finished = pyqtSignal(bool, str)  # Emitted with (success, message) when the test ends
+
+
+class ConnectionTestTask(QRunnable):
+    """Checks that an LMS URL answers, off the GUI thread"""
+    
+    def __init__(self, url: str):
+        super().__init__()
+        self.url = url
+        self.signals = ConnectionTestSignals()
+    
+    def run(self):
+        try:
+            # HEAD is enough to check reachability; fall back to GET where it is refused
+            http = get_shared_session()
+            response = http.head(self.url, timeout=5, allow_redirects=True)
+            if response.status_code == 405:
+                response = http.get(self.url, timeout=5)
+            if response.status_code == 200:
+                self.signals.finished.emit(True, "Connection test successful!")
+            else:
+                self.signals.finished.emit(False, f"Connection test failed: HTTP {response.status_code}")
+        except Exception as e:
+            self.signals.finished.emit(False, f"Connection test failed: {str(e)}")
 
 
 class LMSDialog(QDialog):
@@ -20,6 +50,7 @@ class LMSDialog(QDialog):
         self.setMinimumHeight(300)
         
         self.config_data = None
+        self._test_task = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -153,17 +184,22 @@ class LMSDialog(QDialog):
             QMessageBox.warning(self, "Warning", "URL must start with http:// or https://")
             return
             
-        # Test connection (placeholder implementation)
-        # In a real implementation, this would use the MoodleRestClient
-        try:
-            import requests
-            response = requests.get(url, timeout=5)
-            if response.status_code == 200:
-                QMessageBox.information(self, "Success", "Connection test successful!")
-            else:
-                QMessageBox.warning(self, "Warning", f"Connection test failed: HTTP {response.status_code}")
-        except Exception as e:
-            QMessageBox.warning(self, "Warning", f"Connection test failed: {str(e)}")
+        # Test connection in the background so the dialog stays responsive
+        self.test_button.setEnabled(False)
+        self.test_button.setText("Testing...")
+        self._test_task = ConnectionTestTask(url)
+        self._test_task.signals.finished.connect(self.on_connection_tested)
+        QThreadPool.globalInstance().start(self._test_task)
+        
+    def on_connection_tested(self, success: bool, message: str):
+        """Handle the result of a background connection test"""
+        self._test_task = None
+        self.test_button.setEnabled(True)
+        self.test_button.setText("Test Connection")
+        if success:
+            QMessageBox.information(self, "Success", message)
+        else:
+            QMessageBox.warning(self, "Warning", message)
             
     def connect_to_lms(self):
         """Connect to the selected LMS"""
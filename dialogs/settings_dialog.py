@@ -5,13 +5,68 @@ Provides configuration options for the application
 
 import os
 import json
+from typing import Any, Dict
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
                              QWidget, QGroupBox, QFormLayout, QLineEdit,
                              QSpinBox, QCheckBox, QComboBox, QPushButton,
                              QLabel, QRadioButton, QButtonGroup, QFileDialog,
                              QMessageBox, QColorDialog)
-from PyQt5.QtCore import Qt, QSettings, QSize, pyqtSignal
+from PyQt5.QtCore import Qt, QSize, QTimer, pyqtSignal
 from PyQt5.QtGui import QColor, QFont
+from config import get_settings
+from helpers.lazy_tabs import replace_placeholder_tab
+
+# Raw QSettings values keyed by name, filled once and shared across dialog openings
+_SETTINGS_CACHE: Dict[str, Any] = {}
+
+# Default value of every setting per QSettings group (one group per tab),
+# used when a key has never been stored
+_GROUP_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    'general': {
+        'startup_connect': False,
+        'minimize_tray': False,
+        'confirm_exit': False,
+        'remember_window_size': True,
+        'default_width': 1400,
+        'default_height': 900,
+    },
+    'appearance': {
+        'theme': 'system',
+        'font_family': 'Segoe UI',
+        'font_size': 9,
+        'show_icons': True,
+        'alternate_colors': True,
+    },
+    'connection': {
+        'default_service': 'moodle_mobile_app',
+        'connection_timeout': 30,
+        'retry_attempts': 3,
+        'enable_retry': True,
+        'retry_delay': 5,
+    },
+    'advanced': {
+        'enable_logging': False,
+        'log_level': 'INFO',
+        'enable_cache': True,
+        'cache_duration': 4,
+        'default_export_format': 'Excel (.xlsx)',
+        'auto_open_export': False,
+    },
+}
+
+_DEFAULTS: Dict[str, Any] = {
+    key: default for defaults in _GROUP_DEFAULTS.values() for key, default in defaults.items()
+}
+
+def _coerce(value, default):
+    """Convert a raw QSettings value to the type of its default"""
+    if isinstance(default, bool):
+        if isinstance(value, str):
+            return value.lower() == "true"
+        return bool(value)
+    if isinstance(default, int):
+        return int(value)
+    return value
 
 
 class SettingsDialog(QDialog):
@@ -22,7 +77,7 @@ class SettingsDialog(QDialog):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.settings = QSettings("LMS Explorer", "Settings")
+        self.settings = get_settings()
 
         self.init_ui()
         self.load_settings()
@@ -35,26 +90,29 @@ class SettingsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # Create tab widget
-        tab_widget = QTabWidget()
-
-        # General settings tab
-        general_tab = self.create_general_tab()
-        tab_widget.addTab(general_tab, "General")
-
-        # Appearance settings tab
-        appearance_tab = self.create_appearance_tab()
-        tab_widget.addTab(appearance_tab, "Appearance")
-
-        # Connection settings tab
-        connection_tab = self.create_connection_tab()
-        tab_widget.addTab(connection_tab, "Connection")
-
-        # Advanced settings tab
-        advanced_tab = self.create_advanced_tab()
-        tab_widget.addTab(advanced_tab, "Advanced")
+        # Create tab widget; only the General tab is built up front, the
+        # others are built the first time they are shown
+        self.tab_widget = QTabWidget()
+        self.tab_widget.addTab(self.create_general_tab(), "General")
+        self.tab_widget.addTab(QWidget(), "Appearance")
+        self.tab_widget.addTab(QWidget(), "Connection")
+        self.tab_widget.addTab(QWidget(), "Advanced")
+
+        # Per tab: QSettings group, loader from the cache and getter of the widget values
+        self._tab_io = (
+            ('general', self._load_general, self._general_values),
+            ('appearance', self._load_appearance, self._appearance_values),
+            ('connection', self._load_connection, self._connection_values),
+            ('advanced', self._load_advanced, self._advanced_values),
+        )
+        self._tab_builders = {
+            1: self.create_appearance_tab,
+            2: self.create_connection_tab,
+            3: self.create_advanced_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
 
-        layout.addWidget(tab_widget)
+        layout.addWidget(self.tab_widget)
 
         # Button layout
         button_layout = QHBoxLayout()
@@ -294,131 +352,163 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return tab
 
-    def load_settings(self):
-        """Load settings from QSettings"""
+    def _materialize_tab(self, index):
+        """Build a placeholder tab the first time it is shown"""
+        build = self._tab_builders.pop(index, None)
+        if build is None:
+            return
+
+        replace_placeholder_tab(self.tab_widget, index, build())
+
         try:
-            # General settings
-            self.startup_connect_cb.setChecked(self.settings.value("startup_connect", False, bool))
-            self.minimize_tray_cb.setChecked(self.settings.value("minimize_tray", False, bool))
-            self.confirm_exit_cb.setChecked(self.settings.value("confirm_exit", False, bool))
-            self.remember_window_size_cb.setChecked(self.settings.value("remember_window_size", True, bool))
-
-            # Window settings
-            default_width = self.settings.value("default_width", 1400, int)
-            default_height = self.settings.value("default_height", 900, int)
-            self.default_width_sb.setValue(default_width)
-            self.default_height_sb.setValue(default_height)
-
-            # Appearance settings
-            theme = self.settings.value("theme", "system")
-            if theme == "light":
-                self.light_theme_rb.setChecked(True)
-            elif theme == "dark":
-                self.dark_theme_rb.setChecked(True)
-            else:
-                self.system_theme_rb.setChecked(True)
-
-            font_family = self.settings.value("font_family", "Segoe UI")
-            font_size = self.settings.value("font_size", 9, int)
-            self.font_family_cb.setCurrentText(font_family)
-            self.font_size_sb.setValue(font_size)
-
-            self.show_icons_cb.setChecked(self.settings.value("show_icons", True, bool))
-            self.alternate_colors_cb.setChecked(self.settings.value("alternate_colors", True, bool))
-
-            # Connection settings
-            default_service = self.settings.value("default_service", "moodle_mobile_app")
-            self.default_service_cb.setCurrentText(default_service)
-
-            timeout = self.settings.value("connection_timeout", 30, int)
-            retry_attempts = self.settings.value("retry_attempts", 3, int)
-            self.connection_timeout_sb.setValue(timeout)
-            self.retry_attempts_sb.setValue(retry_attempts)
-
-            self.enable_retry_cb.setChecked(self.settings.value("enable_retry", True, bool))
-            retry_delay = self.settings.value("retry_delay", 5, int)
-            self.retry_delay_sb.setValue(retry_delay)
-
-            # Advanced settings
-            self.enable_logging_cb.setChecked(self.settings.value("enable_logging", False, bool))
-            log_level = self.settings.value("log_level", "INFO")
-            self.log_level_cb.setCurrentText(log_level)
-
-            self.enable_cache_cb.setChecked(self.settings.value("enable_cache", True, bool))
-            cache_duration = self.settings.value("cache_duration", 4, int)
-            self.cache_duration_sb.setValue(cache_duration)
-
-            default_format = self.settings.value("default_export_format", "Excel (.xlsx)")
-            self.default_export_format_cb.setCurrentText(default_format)
-            self.auto_open_export_cb.setChecked(self.settings.value("auto_open_export", False, bool))
+            self._load_cache()
+            self._tab_io[index][1]()
+        except Exception as e:
+            QMessageBox.warning(self, "Settings Error", f"Failed to load settings: {str(e)}")
+
+    def _built_tabs(self):
+        """Get the group, loader and value getter of every tab built so far"""
+        builders = self._tab_builders
+        return [io for index, io in enumerate(self._tab_io) if index not in builders]
+
+    def _load_cache(self):
+        """Read every stored key into the settings cache in a single pass"""
+        if not _SETTINGS_CACHE:
+            settings = self.settings
+            # Ungrouped keys written by earlier versions serve as fallbacks
+            _SETTINGS_CACHE.update(
+                (key, settings.value(key)) for key in settings.childKeys() if key in _DEFAULTS
+            )
+            for group in _GROUP_DEFAULTS:
+                settings.beginGroup(group)
+                try:
+                    _SETTINGS_CACHE.update((key, settings.value(key)) for key in settings.childKeys())
+                finally:
+                    settings.endGroup()
+
+    def _cached(self, key):
+        """Get a cached setting converted to the type of its default"""
+        default = _DEFAULTS[key]
+        value = _SETTINGS_CACHE.get(key)
+        if value is None:
+            return default
+        return _coerce(value, default)
 
+    def load_settings(self):
+        """Load settings of the built tabs from the in-memory cache of QSettings"""
+        try:
+            self._load_cache()
+            for _, load, _ in self._built_tabs():
+                load()
         except Exception as e:
             QMessageBox.warning(self, "Settings Error", f"Failed to load settings: {str(e)}")
 
+    def _load_general(self):
+        """Populate the general tab from the settings cache"""
+        self.startup_connect_cb.setChecked(self._cached("startup_connect"))
+        self.minimize_tray_cb.setChecked(self._cached("minimize_tray"))
+        self.confirm_exit_cb.setChecked(self._cached("confirm_exit"))
+        self.remember_window_size_cb.setChecked(self._cached("remember_window_size"))
+
+        # Window settings
+        self.default_width_sb.setValue(self._cached("default_width"))
+        self.default_height_sb.setValue(self._cached("default_height"))
+
+    def _load_appearance(self):
+        """Populate the appearance tab from the settings cache"""
+        theme = self._cached("theme")
+        if theme == "light":
+            self.light_theme_rb.setChecked(True)
+        elif theme == "dark":
+            self.dark_theme_rb.setChecked(True)
+        else:
+            self.system_theme_rb.setChecked(True)
+
+        self.font_family_cb.setCurrentText(self._cached("font_family"))
+        self.font_size_sb.setValue(self._cached("font_size"))
+
+        self.show_icons_cb.setChecked(self._cached("show_icons"))
+        self.alternate_colors_cb.setChecked(self._cached("alternate_colors"))
+
+    def _load_connection(self):
+        """Populate the connection tab from the settings cache"""
+        self.default_service_cb.setCurrentText(self._cached("default_service"))
+        self.connection_timeout_sb.setValue(self._cached("connection_timeout"))
+        self.retry_attempts_sb.setValue(self._cached("retry_attempts"))
+
+        self.enable_retry_cb.setChecked(self._cached("enable_retry"))
+        self.retry_delay_sb.setValue(self._cached("retry_delay"))
+
+    def _load_advanced(self):
+        """Populate the advanced tab from the settings cache"""
+        self.enable_logging_cb.setChecked(self._cached("enable_logging"))
+        self.log_level_cb.setCurrentText(self._cached("log_level"))
+
+        self.enable_cache_cb.setChecked(self._cached("enable_cache"))
+        self.cache_duration_sb.setValue(self._cached("cache_duration"))
+
+        self.default_export_format_cb.setCurrentText(self._cached("default_export_format"))
+        self.auto_open_export_cb.setChecked(self._cached("auto_open_export"))
+
+    def _put(self, key, value):
+        """Write a setting through the cache to the current QSettings group, skipping unchanged values"""
+        cached = _SETTINGS_CACHE.get(key)
+        if cached is not None and _coerce(cached, value) == value:
+            return
+        _SETTINGS_CACHE[key] = value
+        self.settings.setValue(key, value)
+
     def save_settings(self):
-        """Save settings to QSettings"""
+        """Save changed settings of the built tabs to QSettings and the settings cache"""
         try:
-            # General settings
-            self.settings.setValue("startup_connect", self.startup_connect_cb.isChecked())
-            self.settings.setValue("minimize_tray", self.minimize_tray_cb.isChecked())
-            self.settings.setValue("confirm_exit", self.confirm_exit_cb.isChecked())
-            self.settings.setValue("remember_window_size", self.remember_window_size_cb.isChecked())
-
-            # Window settings
-            self.settings.setValue("default_width", self.default_width_sb.value())
-            self.settings.setValue("default_height", self.default_height_sb.value())
-
-            # Appearance settings
-            theme = "system"
-            if self.light_theme_rb.isChecked():
-                theme = "light"
-            elif self.dark_theme_rb.isChecked():
-                theme = "dark"
-            self.settings.setValue("theme", theme)
-
-            self.settings.setValue("font_family", self.font_family_cb.currentText())
-            self.settings.setValue("font_size", self.font_size_sb.value())
-            self.settings.setValue("show_icons", self.show_icons_cb.isChecked())
-            self.settings.setValue("alternate_colors", self.alternate_colors_cb.isChecked())
-
-            # Connection settings
-            self.settings.setValue("default_service", self.default_service_cb.currentText())
-            self.settings.setValue("connection_timeout", self.connection_timeout_sb.value())
-            self.settings.setValue("retry_attempts", self.retry_attempts_sb.value())
-            self.settings.setValue("enable_retry", self.enable_retry_cb.isChecked())
-            self.settings.setValue("retry_delay", self.retry_delay_sb.value())
-
-            # Advanced settings
-            self.settings.setValue("enable_logging", self.enable_logging_cb.isChecked())
-            self.settings.setValue("log_level", self.log_level_cb.currentText())
-            self.settings.setValue("enable_cache", self.enable_cache_cb.isChecked())
-            self.settings.setValue("cache_duration", self.cache_duration_sb.value())
-            self.settings.setValue("default_export_format", self.default_export_format_cb.currentText())
-            self.settings.setValue("auto_open_export", self.auto_open_export_cb.isChecked())
-
-            # Sync settings immediately
-            self.settings.sync()
+            self._load_cache()
+            settings = self.settings
+            for group, _, values in self._built_tabs():
+                settings.beginGroup(group)
+                try:
+                    for key, value in values().items():
+                        self._put(key, value)
+                finally:
+                    settings.endGroup()
+
+            # Flush to disk once control returns to the event loop
+            QTimer.singleShot(0, self.settings.sync)
 
         except Exception as e:
             QMessageBox.warning(self, "Settings Error", f"Failed to save settings: {str(e)}")
 
-    def apply_settings(self):
+    def apply_settings(self, checked=False):
         """Apply settings without closing dialog"""
         settings_dict = self.get_settings_dict()
         self.save_settings()
 
         # Emit signal with current settings
         self.settings_changed.emit(settings_dict)
+        # Listeners may have written to QSettings; re-read it on next load
+        _SETTINGS_CACHE.clear()
 
         QMessageBox.information(self, "Settings Applied", "Settings have been applied successfully.")
 
-    def accept_settings(self):
+    def accept_settings(self, checked=False):
         """Accept and save settings"""
         self.save_settings()
         self.accept()
 
+    def closeEvent(self, event):
+        """Flush pending settings writes when the dialog closes"""
+        self.settings.sync()
+        super().closeEvent(event)
+
     def get_settings_dict(self):
-        """Get current settings as dictionary"""
+        """Get current settings as dictionary; unbuilt tabs report their cached values"""
+        self._load_cache()
+        settings_dict = {key: self._cached(key) for key in _DEFAULTS}
+        for _, _, values in self._built_tabs():
+            settings_dict.update(values())
+        return settings_dict
+
+    def _general_values(self):
+        """Get the general tab settings"""
         return {
             'startup_connect': self.startup_connect_cb.isChecked(),
             'minimize_tray': self.minimize_tray_cb.isChecked(),
@@ -426,16 +516,31 @@ class SettingsDialog(QDialog):
             'remember_window_size': self.remember_window_size_cb.isChecked(),
             'default_width': self.default_width_sb.value(),
             'default_height': self.default_height_sb.value(),
+        }
+
+    def _appearance_values(self):
+        """Get the appearance tab settings"""
+        return {
             'theme': 'light' if self.light_theme_rb.isChecked() else ('dark' if self.dark_theme_rb.isChecked() else 'system'),
             'font_family': self.font_family_cb.currentText(),
             'font_size': self.font_size_sb.value(),
             'show_icons': self.show_icons_cb.isChecked(),
             'alternate_colors': self.alternate_colors_cb.isChecked(),
+        }
+
+    def _connection_values(self):
+        """Get the connection tab settings"""
+        return {
             'default_service': self.default_service_cb.currentText(),
             'connection_timeout': self.connection_timeout_sb.value(),
             'retry_attempts': self.retry_attempts_sb.value(),
             'enable_retry': self.enable_retry_cb.isChecked(),
             'retry_delay': self.retry_delay_sb.value(),
+        }
+
+    def _advanced_values(self):
+        """Get the advanced tab settings"""
+        return {
             'enable_logging': self.enable_logging_cb.isChecked(),
             'log_level': self.log_level_cb.currentText(),
             'enable_cache': self.enable_cache_cb.isChecked(),
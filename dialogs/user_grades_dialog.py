@@ -4,13 +4,53 @@ Dialog to display user grades and grade information
 """
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QTreeWidget, QTreeWidgetItem, 
-                             QTextEdit, QMessageBox, QTableWidget, 
-                             QTableWidgetItem, QHeaderView)
-from PyQt5.QtCore import Qt
+                             QPushButton, QTableView, QTextEdit, QMessageBox,
+                             QAbstractItemView)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
 from lms_interface import IUser, ICourse, IGradeItem
 
 
+class GradeItemsModel(QAbstractTableModel):
+    """Table model over a course's grade items"""
+    
+    HEADERS = ("Grade Item", "Grade", "Maximum Grade", "Percentage")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._grade_items = []
+    
+    def set_grade_items(self, grade_items):
+        """Replace the listed grade items"""
+        self.beginResetModel()
+        self._grade_items = list(grade_items)
+        self.endResetModel()
+    
+    def grade_item(self, row: int) -> IGradeItem:
+        return self._grade_items[row]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._grade_items)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            return self._grade_items[row].get_item_name() or f"Grade Item {row + 1}"
+        # Grade, maximum grade and percentage are placeholders - the actual
+        # user grade would need to be fetched from the API
+        return "100" if column == 2 else "N/A"
+    
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
 class UserGradesDialog(QDialog):
     """Dialog to display user grades"""
     
@@ -18,7 +58,9 @@ class UserGradesDialog(QDialog):
         super().__init__(parent)
         
         self.user = user
-        self.setWindowTitle(f"User Grades - {user.full_name or f'{user.first_name} {user.last_name}'}")
+        self._course = user.get_course()
+        self._display_name = user.full_name or f"{user.first_name} {user.last_name}"
+        self.setWindowTitle(f"User Grades - {self._display_name}")
         self.setModal(True)
         self.setMinimumWidth(800)
         self.setMinimumHeight(600)
@@ -31,22 +73,24 @@ class UserGradesDialog(QDialog):
         layout = QVBoxLayout()
         
         # Header
-        header_label = QLabel(f"User: {self.full_name or f'{self.user.first_name} {self.user.last_name}'}")
+        header_label = QLabel(f"User: {self._display_name}")
         header_label.setStyleSheet("font-size: 16px; font-weight: bold; margin: 10px;")
         layout.addWidget(header_label)
         
         # Course info
-        course = self.user.get_course()
+        course = self._course
         if course:
             course_label = QLabel(f"Course: {course.fullname or course.shortname}")
             course_label.setStyleSheet("font-size: 14px; margin: 5px;")
             layout.addWidget(course_label)
         
         # Grades table
-        self.grades_table = QTableWidget()
-        self.grades_table.setColumnCount(4)
-        self.grades_table.setHorizontalHeaderLabels(["Grade Item", "Grade", "Maximum Grade", "Percentage"])
-        self.grades_table.itemSelectionChanged.connect(self.on_grade_selected)
+        self.grades_model = GradeItemsModel(self)
+        self.grades_table = QTableView()
+        self.grades_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.grades_table.setModel(self.grades_model)
+        self.grades_table.horizontalHeader().setStretchLastSection(True)
+        self.grades_table.selectionModel().selectionChanged.connect(self.on_grade_selected)
         layout.addWidget(self.grades_table)
         
         # Details section
@@ -69,7 +113,7 @@ class UserGradesDialog(QDialog):
         button_layout = QHBoxLayout()
         
         refresh_btn = QPushButton("Refresh")
-        refresh_btn.clicked.connect(self.load_grades)
+        refresh_btn.clicked.connect(self.refresh_grades)
         button_layout.addWidget(refresh_btn)
         
         close_btn = QPushButton("Close")
@@ -79,13 +123,13 @@ class UserGradesDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
         
-    def load_grades(self):
+    def load_grades(self, checked=False):
         """Load user grades"""
-        self.grades_table.setRowCount(0)
+        self.grades_model.set_grade_items([])
         self.details_text.clear()
         
         try:
-            course = self.user.get_course()
+            course = self._course
             if not course:
                 self.details_text.setText("User is not associated with any course.")
                 return
@@ -97,45 +141,29 @@ class UserGradesDialog(QDialog):
                 self.details_text.setText("No grade items found for this course.")
                 return
             
-            # Populate the grades table
-            self.grades_table.setRowCount(len(grade_items))
-            
-            for row, grade_item in enumerate(grade_items):
-                # Grade item name
-                name_item = QTableWidgetItem(grade_item.get_item_name() or f"Grade Item {row + 1}")
-                name_item.setData(Qt.UserRole, grade_item)
-                self.grades_table.setItem(row, 0, name_item)
-                
-                # Grade (placeholder - would need to get actual user grade from API)
-                grade_item_widget = QTableWidgetItem("N/A")
-                self.grades_table.setItem(row, 1, grade_item_widget)
-                
-                # Maximum grade (placeholder)
-                max_grade_item = QTableWidgetItem("100")
-                self.grades_table.setItem(row, 2, max_grade_item)
-                
-                # Percentage (placeholder)
-                percentage_item = QTableWidgetItem("N/A")
-                self.grades_table.setItem(row, 3, percentage_item)
-            
-            # Resize columns
-            self.grades_table.horizontalHeader().resizeSections(QHeaderView.ResizeToContents)
-            self.grades_table.horizontalHeader().setStretchLastSection(True)
+            # Populate the grades table with a single model reset, then size
+            # the columns once
+            self.grades_model.set_grade_items(grade_items)
+            self.grades_table.resizeColumnsToContents()
             
             self.details_text.setText(f"Loaded {len(grade_items)} grade items for this course.")
             
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load user grades: {str(e)}")
             
-    def on_grade_selected(self):
+    def refresh_grades(self, checked=False):
+        """Re-fetch the user's course and reload the grades"""
+        self._course = self.user.get_course()
+        self.load_grades()
+            
+    def on_grade_selected(self, selected=None, deselected=None):
         """Handle grade item selection"""
-        selected_items = self.grades_table.selectedItems()
-        if not selected_items:
+        selected_rows = self.grades_table.selectionModel().selectedRows()
+        if not selected_rows:
             return
         
-        # Get the row of the first selected item
-        row = selected_items[0].row()
-        grade_item = self.grades_table.item(row, 0).data(Qt.UserRole)
+        # Get the first selected row
+        grade_item = self.grades_model.grade_item(selected_rows[0].row())
         
         if grade_item:
             self.show_grade_details(grade_item)
@@ -148,12 +176,12 @@ class UserGradesDialog(QDialog):
         details += f"Item Type: Grade Item\n"
         
         # Add course information
-        course = self.user.get_course()
+        course = self._course
         if course:
             details += f"Course: {course.fullname or course.shortname}\n"
         
         # Add user information
-        details += f"User: {self.user.full_name or f'{self.user.first_name} {self.user.last_name}'}\n"
+        details += f"User: {self._display_name}\n"
         details += f"User ID: {self.user.id}\n"
         
         # Note: In a real implementation, you would fetch the actual grade data
@@ -3,17 +3,22 @@ Forms Package
 Contains various form/dialog implementations for LMS Explorer
 """
 
-from .category_form import CategoryForm
-from .course_form import CourseForm
-from .user_form import UserForm
-from .user_password_form import UserPasswordForm
-from .users_group_form import UsersGroupForm
-from .section_form import SectionForm
-from .module_form import ModuleForm
-from .content_form import ContentForm
-from .section_module_form import SectionModuleForm
-from .module_content_form import ModuleContentForm
-from .module_content_one_form import ModuleContentOneForm
+import importlib
+
+# Form class name -> submodule defining it; imported on first access (PEP 562)
+_LAZY = {
+    'CategoryForm': 'category_form',
+    'CourseForm': 'course_form',
+    'UserForm': 'user_form',
+    'UserPasswordForm': 'user_password_form',
+    'UsersGroupForm': 'users_group_form',
+    'SectionForm': 'section_form',
+    'ModuleForm': 'module_form',
+    'ContentForm': 'content_form',
+    'SectionModuleForm': 'section_module_form',
+    'ModuleContentForm': 'module_content_form',
+    'ModuleContentOneForm': 'module_content_one_form',
+}
 
 __all__ = [
     'CategoryForm',
@@ -28,3 +33,18 @@ __all__ = [
     'ModuleContentForm',
     'ModuleContentOneForm'
 ]
+
+
+def __getattr__(name):
+    """Import the form submodule defining name on first access"""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily exported form classes alongside the module globals"""
+    return sorted(set(globals()) | set(__all__))
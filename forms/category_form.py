@@ -3,16 +3,32 @@ Category Form
 Form for displaying category information and courses
 """
 
-from typing import Optional
+from typing import Callable, Optional
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QToolBar, QAction, QTabWidget, QStatusBar, QLabel,
                              QApplication)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from lms_interface import ICategory
 from tree_views.course_category_tree import CourseCategoryTreeWidget
 from helpers.browser import BrowserHelper
+from helpers.logger import LogHelper
+
+
+class BrowserLaunchTask(QRunnable):
+    """Opens one course page in the browser, off the GUI thread"""
+    
+    def __init__(self, open_course: Callable[[object], object], course):
+        super().__init__()
+        self.open_course = open_course
+        self.course = course
+    
+    def run(self):
+        try:
+            self.open_course(self.course)
+        except Exception as e:
+            LogHelper.log_error(f"Failed to open in browser: {str(e)}")
 
 
 class CategoryForm(QMainWindow):
@@ -23,6 +39,9 @@ class CategoryForm(QMainWindow):
         
         self.category: Optional[ICategory] = None
         self.category_tree_view: Optional[CourseCategoryTreeWidget] = None
+        # Whether the category has sub-categories, read when the category is set
+        # or refreshed; call refresh() after mutating the category externally
+        self._has_subcategories = False
         
         self.setup_ui()
         self.setup_actions()
@@ -32,9 +51,9 @@ class CategoryForm(QMainWindow):
         self.setWindowTitle("Category")
         self.resize(800, 600)
         
-        # Create central widget and layout
+        # Create central widget and layout; the widget is installed once it is
+        # fully built, so it is polished and laid out in a single pass
         central_widget = QWidget()
-        self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
         
         # Create toolbar
@@ -49,6 +68,8 @@ class CategoryForm(QMainWindow):
         self.category_tree_view = CourseCategoryTreeWidget()
         self.tab_widget.addTab(self.category_tree_view, "Courses")
         
+        self.setCentralWidget(central_widget)
+        
         # Create status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
@@ -82,20 +103,26 @@ class CategoryForm(QMainWindow):
     def set_category(self, category: ICategory):
         """Set the category and update the form"""
         self.category = category
+        self._has_subcategories = self._read_has_subcategories()
         
         if category:
             self.setWindowTitle(f"Category: {category.name}")
-            self.category_tree_view.set_category(category)
+            with self.category_tree_view.bulk_update():
+                self.category_tree_view.set_category(category)
             self.update_action_states()
         else:
             self.setWindowTitle("Category")
             self.category_tree_view.clear_category()
             
+    def _read_has_subcategories(self) -> bool:
+        """Read whether the current category has sub-categories"""
+        return bool(self.category and self.category.sub_categories_count > 0)
+        
     def update_action_states(self):
         """Update action enabled states"""
         if self.category:
             # Enable actions only if category has no subcategories
-            has_subcategories = self.category.sub_categories_count > 0
+            has_subcategories = self._has_subcategories
             self.open_all_courses_action.setEnabled(not has_subcategories)
             self.open_all_users_action.setEnabled(not has_subcategories)
         else:
@@ -105,19 +132,31 @@ class CategoryForm(QMainWindow):
     def open_all_courses(self):
         """Open all courses in browser"""
         if self.category:
-            for course in self.category.courses:
-                BrowserHelper.open_course(course)
+            self._open_courses_in_background(BrowserHelper.open_course, "courses")
                 
     def open_all_users(self):
         """Open all users in browser"""
         if self.category:
-            for course in self.category.courses:
-                BrowserHelper.open_course_users(course)
+            self._open_courses_in_background(BrowserHelper.open_course_users, "course user lists")
+            
+    def _open_courses_in_background(self, open_course, description: str):
+        """Start one browser launch per course in the category on the global thread pool"""
+        # Snapshot the courses so a refresh during submission cannot change the batch
+        courses = tuple(self.category.courses)
+        try:
+            pool = QThreadPool.globalInstance()
+            for course in courses:
+                pool.start(BrowserLaunchTask(open_course, course))
+            self.status_bar.showMessage(f"Opening {len(courses)} {description}...", 3000)
+        except Exception as e:
+            LogHelper.log_error(f"Failed to open {description}: {str(e)}")
                 
     def refresh(self):
         """Refresh the category data"""
         if self.category:
+            self._has_subcategories = self._read_has_subcategories()
             self.category_tree_view.refresh()
+            self.update_action_states()
             
     def on_course_double_clicked(self, course):
         """Handle course double click"""
@@ -126,7 +165,7 @@ class CategoryForm(QMainWindow):
         
     def closeEvent(self, event):
         """Handle form close event"""
-        # Clean up resources
-        if self.category_tree_view:
+        # Clean up resources; a form deleted on close takes its tree with it
+        if self.category_tree_view and not self.testAttribute(Qt.WA_DeleteOnClose):
             self.category_tree_view.clear_category()
         super().closeEvent(event)
@@ -3,15 +3,57 @@ Content Form
 Form for displaying content information and details
 """
 
+from functools import lru_cache
 from typing import Optional
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QLineEdit, QTextEdit, QPushButton, QGroupBox,
-                             QFormLayout, QTabWidget, QApplication)
-from PyQt5.QtCore import Qt, pyqtSignal
+                             QLabel, QTextEdit, QPushButton, QGroupBox,
+                             QTabWidget, QApplication, QTableWidget, QTableWidgetItem,
+                             QAbstractItemView, QHeaderView)
+from PyQt5.QtCore import Qt, QSignalBlocker, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from lms_interface import IContent, ICourse, IModule, ISection
 from helpers.browser import BrowserHelper
+from helpers.lazy_tabs import replace_placeholder_tab
+from helpers.text_fields import set_text
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# (key, label) of the read-only fields listed in the information table
+_INFO_FIELDS = (
+    ('id', "ID"),
+    ('name', "Name"),
+    ('filename', "Filename"),
+    ('filepath', "Filepath"),
+    ('fileurl', "File URL"),
+    ('mimetype', "MIME Type"),
+    ('size', "Size"),
+    ('time_created', "Time Created"),
+    ('time_modified', "Time Modified"),
+    ('visible', "Visible"),
+    ('status', "Status"),
+    ('sort_order', "Sort Order"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _format_file_size(size_bytes: int) -> str:
+    """Format file size in human readable format, picking the unit from the bit length"""
+    if not size_bytes:
+        return ""
+    # Sizes below one byte have a bit length of 0, so clamp to the bytes unit
+    index = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.1f} {_SIZE_UNITS[index]}"
+
+
+# Preview text per top-level MIME type; this would typically load and display
+# the content itself, for now placeholders are shown
+_PREVIEW_TEXTS = {
+    'text': "Text content preview would be displayed here...",
+    'image': "Image preview would be displayed here...",
+}
+_NO_PREVIEW_TEXT = "Preview not available for this file type."
 
 
 class ContentForm(QDialog):
@@ -24,6 +66,9 @@ class ContentForm(QDialog):
         self.course: Optional[ICourse] = None
         self.module: Optional[IModule] = None
         self.section: Optional[ISection] = None
+        # Preview tab is built on first show and refreshed only when visible
+        self.preview_edit: Optional[QTextEdit] = None
+        self._preview_dirty = True
         
         self.setup_ui()
         self.setup_actions()
@@ -33,8 +78,9 @@ class ContentForm(QDialog):
         self.setWindowTitle("Content Information")
         self.resize(600, 500)
         
-        # Create main layout
-        main_layout = QVBoxLayout(self)
+        # Create main layout; it is installed on the dialog once fully built,
+        # so the widgets are polished and laid out in a single pass
+        main_layout = QVBoxLayout()
         
         # Create tab widget
         self.tab_widget = QTabWidget()
@@ -43,8 +89,9 @@ class ContentForm(QDialog):
         # Create info tab
         self.create_info_tab()
         
-        # Create preview tab
-        self.create_preview_tab()
+        # Add a placeholder for the preview tab; it is built on first show
+        self._preview_index = self.tab_widget.addTab(QWidget(), "Preview")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # Create button layout
         button_layout = QHBoxLayout()
@@ -65,76 +112,26 @@ class ContentForm(QDialog):
         button_layout.addWidget(self.close_button)
         
         main_layout.addLayout(button_layout)
+        self.setLayout(main_layout)
         
     def create_info_tab(self):
         """Create the content information tab"""
         info_widget = QWidget()
-        info_layout = QFormLayout(info_widget)
-        
-        # Basic information group
-        basic_group = QGroupBox("Basic Information")
-        basic_layout = QFormLayout(basic_group)
-        
-        self.id_label = QLabel()
-        basic_layout.addRow("ID:", self.id_label)
-        
-        self.name_edit = QLineEdit()
-        self.name_edit.setReadOnly(True)
-        basic_layout.addRow("Name:", self.name_edit)
-        
-        self.filename_edit = QLineEdit()
-        self.filename_edit.setReadOnly(True)
-        basic_layout.addRow("Filename:", self.filename_edit)
-        
-        self.filepath_edit = QLineEdit()
-        self.filepath_edit.setReadOnly(True)
-        basic_layout.addRow("Filepath:", self.filepath_edit)
-        
-        self.fileurl_edit = QLineEdit()
-        self.fileurl_edit.setReadOnly(True)
-        basic_layout.addRow("File URL:", self.fileurl_edit)
-        
-        info_layout.addWidget(basic_group)
-        
-        # File information group
-        file_group = QGroupBox("File Information")
-        file_layout = QFormLayout(file_group)
-        
-        self.mimetype_edit = QLineEdit()
-        self.mimetype_edit.setReadOnly(True)
-        file_layout.addRow("MIME Type:", self.mimetype_edit)
-        
-        self.size_edit = QLineEdit()
-        self.size_edit.setReadOnly(True)
-        file_layout.addRow("Size:", self.size_edit)
-        
-        self.time_created_edit = QLineEdit()
-        self.time_created_edit.setReadOnly(True)
-        file_layout.addRow("Time Created:", self.time_created_edit)
-        
-        self.time_modified_edit = QLineEdit()
-        self.time_modified_edit.setReadOnly(True)
-        file_layout.addRow("Time Modified:", self.time_modified_edit)
-        
-        info_layout.addWidget(file_group)
-        
-        # Status information group
-        status_group = QGroupBox("Status Information")
-        status_layout = QFormLayout(status_group)
-        
-        self.visible_edit = QLineEdit()
-        self.visible_edit.setReadOnly(True)
-        status_layout.addRow("Visible:", self.visible_edit)
-        
-        self.status_edit = QLineEdit()
-        self.status_edit.setReadOnly(True)
-        status_layout.addRow("Status:", self.status_edit)
-        
-        self.sort_order_edit = QLineEdit()
-        self.sort_order_edit.setReadOnly(True)
-        status_layout.addRow("Sort Order:", self.sort_order_edit)
-        
-        info_layout.addWidget(status_group)
+        info_layout = QVBoxLayout(info_widget)
+        
+        # One read-only table holds every field instead of a line edit per field
+        self.info_table = QTableWidget(len(_INFO_FIELDS), 2)
+        self.info_table.horizontalHeader().hide()
+        self.info_table.verticalHeader().hide()
+        self.info_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._field_rows = {}
+        for row, (key, label) in enumerate(_INFO_FIELDS):
+            self.info_table.setItem(row, 0, QTableWidgetItem(label))
+            self.info_table.setItem(row, 1, QTableWidgetItem())
+            self._field_rows[key] = row
+        self.info_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.info_table.horizontalHeader().setStretchLastSection(True)
+        info_layout.addWidget(self.info_table)
         
         # Description group
         description_group = QGroupBox("Description")
@@ -169,7 +166,18 @@ class ContentForm(QDialog):
         self.preview_edit.setPlaceholderText("Content preview will be displayed here...")
         preview_layout.addWidget(self.preview_edit)
         
-        self.tab_widget.addTab(preview_widget, "Preview")
+        return preview_widget
+        
+    def on_tab_changed(self, index: int):
+        """Build and fill the preview tab when it is shown"""
+        if index != self._preview_index:
+            return
+        
+        if self.preview_edit is None:
+            replace_placeholder_tab(self.tab_widget, index, self.create_preview_tab())
+        
+        if self._preview_dirty:
+            self.update_preview()
         
     def setup_actions(self):
         """Setup actions and signals"""
@@ -186,7 +194,9 @@ class ContentForm(QDialog):
         if content:
             self.setWindowTitle(f"Content: {content.name}")
             self.update_content_info()
-            self.update_preview()
+            self._preview_dirty = True
+            if self.tab_widget.currentIndex() == self._preview_index:
+                self.on_tab_changed(self._preview_index)
             self.update_button_states()
         else:
             self.setWindowTitle("Content Information")
@@ -197,38 +207,52 @@ class ContentForm(QDialog):
         if not self.content:
             return
             
-        self.id_label.setText(str(self.content.id))
-        self.name_edit.setText(self.content.name or "")
-        self.filename_edit.setText(self.content.filename or "")
-        self.filepath_edit.setText(self.content.filepath or "")
-        self.fileurl_edit.setText(self.content.fileurl or "")
-        self.mimetype_edit.setText(self.content.mimetype or "")
-        self.size_edit.setText(self.format_file_size(self.content.size) if self.content.size else "")
-        self.time_created_edit.setText(self.content.time_created or "")
-        self.time_modified_edit.setText(self.content.time_modified or "")
-        self.visible_edit.setText(str(self.content.visible) if self.content.visible is not None else "")
-        self.status_edit.setText(self.content.status or "")
-        self.sort_order_edit.setText(str(self.content.sort_order) if self.content.sort_order is not None else "")
-        self.description_edit.setText(self.content.description or "")
-        self.notes_edit.setText(self.content.notes or "")
+        content = self.content
+        # Repaint the fields once, after all of them are set
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self._set_fields({
+                'id': str(content.id),
+                'name': content.name or "",
+                'filename': content.filename or "",
+                'filepath': content.filepath or "",
+                'fileurl': content.fileurl or "",
+                'mimetype': content.mimetype or "",
+                'size': _format_file_size(content.size),
+                'time_created': content.time_created or "",
+                'time_modified': content.time_modified or "",
+                'visible': str(content.visible) if content.visible is not None else "",
+                'status': content.status or "",
+                'sort_order': str(content.sort_order) if content.sort_order is not None else "",
+            })
+            set_text(self.description_edit, content.description or "")
+            set_text(self.notes_edit, content.notes or "")
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+        
+    def _set_fields(self, values):
+        """Write field values into the information table, skipping unchanged cells"""
+        table = self.info_table
+        field_rows = self._field_rows
+        with QSignalBlocker(table):
+            for key, value in values.items():
+                item = table.item(field_rows[key], 1)
+                if item.text() != value:
+                    item.setText(value)
         
     def update_preview(self):
         """Update the content preview"""
+        if self.preview_edit is None:
+            return
+        self._preview_dirty = False
+        
         if not self.content:
             self.preview_edit.clear()
             return
             
-        # This would typically load and display content preview
-        # For now, we'll show a placeholder
-        if self.content.mimetype and self.content.mimetype.startswith("text/"):
-            # For text files, we could load the content
-            self.preview_edit.setText("Text content preview would be displayed here...")
-        elif self.content.mimetype and self.content.mimetype.startswith("image/"):
-            # For images, we could show the image
-            self.preview_edit.setText("Image preview would be displayed here...")
-        else:
-            # For other file types
-            self.preview_edit.setText("Preview not available for this file type.")
+        # Dispatch on the top-level MIME type, e.g. 'text' for 'text/plain'
+        top_level_type = (self.content.mimetype or "").partition("/")[0]
+        self.preview_edit.setPlainText(_PREVIEW_TEXTS.get(top_level_type, _NO_PREVIEW_TEXT))
             
     def update_button_states(self):
         """Update button enabled states"""
@@ -249,35 +273,23 @@ class ContentForm(QDialog):
             
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in human readable format"""
-        if not size_bytes:
-            return ""
-            
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        return _format_file_size(size_bytes)
         
     def clear_form(self):
         """Clear all form fields"""
-        self.id_label.setText("")
-        self.name_edit.setText("")
-        self.filename_edit.setText("")
-        self.filepath_edit.setText("")
-        self.fileurl_edit.setText("")
-        self.mimetype_edit.setText("")
-        self.size_edit.setText("")
-        self.time_created_edit.setText("")
-        self.time_modified_edit.setText("")
-        self.visible_edit.setText("")
-        self.status_edit.setText("")
-        self.sort_order_edit.setText("")
-        self.description_edit.setText("")
-        self.notes_edit.setText("")
-        self.preview_edit.clear()
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            self._set_fields(dict.fromkeys(self._field_rows, ""))
+            for text_edit in (self.description_edit, self.notes_edit, self.preview_edit):
+                if text_edit is not None and not text_edit.document().isEmpty():
+                    text_edit.clear()
+            self._preview_dirty = True
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
         
     def closeEvent(self, event):
         """Handle form close event"""
-        # Clean up resources
-        self.clear_form()
+        # Clean up resources; a form deleted on close takes its widgets with it
+        if not self.testAttribute(Qt.WA_DeleteOnClose):
+            self.clear_form()
         super().closeEvent(event)
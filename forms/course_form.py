@@ -3,11 +3,12 @@ Course Form
 Form for displaying course information, content, and users
 """
 
-from typing import Optional
+from functools import partial
+from typing import Callable, Optional
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QToolBar, QAction, QTabWidget, QStatusBar, QLabel,
                              QLineEdit, QApplication, QSplitter)
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from lms_interface import ICourse, IUser
@@ -18,6 +19,29 @@ from helpers.reports import ReportsHelper
 from helpers.logger import LogHelper
 
 
+class CourseTaskSignals(QObject):
+    """Signals emitted by CourseTask"""
+    
+    finished = pyqtSignal(bool, str)  # Emitted with (success, error message) when the task ends
+
+
+class CourseTask(QRunnable):
+    """Runs a long course operation, such as an export, off the GUI thread"""
+    
+    def __init__(self, work: Callable[[], object]):
+        super().__init__()
+        self.work = work
+        self.signals = CourseTaskSignals()
+    
+    def run(self):
+        try:
+            self.work()
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+        else:
+            self.signals.finished.emit(True, "")
+
+
 class CourseForm(QMainWindow):
     """Form for displaying course information, content, and users"""
     
@@ -28,6 +52,11 @@ class CourseForm(QMainWindow):
         self.filter_user: Optional[IUser] = None
         self.course_content_tree: Optional[CourseContentTreeWidget] = None
         self.course_users_tree: Optional[CourseUsersTreeWidget] = None
+        self._pending_filter = ""
+        self._export_task: Optional[CourseTask] = None
+        self._download_task: Optional[CourseTask] = None
+        # Trees in hidden tabs that missed a refresh; refreshed when their tab is shown
+        self._stale_trees = set()
         
         self.setup_ui()
         self.setup_actions()
@@ -37,9 +66,9 @@ class CourseForm(QMainWindow):
         self.setWindowTitle("Course")
         self.resize(1000, 700)
         
-        # Create central widget and layout
+        # Create central widget and layout; the widget is installed once it is
+        # fully built, so it is polished and laid out in a single pass
         central_widget = QWidget()
-        self.setCentralWidget(central_widget)
         layout = QVBoxLayout(central_widget)
         
         # Create toolbar
@@ -85,10 +114,18 @@ class CourseForm(QMainWindow):
         # Add content tab
         self.tab_widget.addTab(content_widget, "Content")
         
+        self.setCentralWidget(central_widget)
+        
         # Create status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         
+        # Filter the users tree once typing pauses instead of on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        
         # Connect signals
         self.filter_edit.textChanged.connect(self.on_filter_changed)
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
@@ -138,11 +175,14 @@ class CourseForm(QMainWindow):
     def set_course(self, course: ICourse):
         """Set the course and update the form"""
         self.course = course
+        self._stale_trees.clear()
         
         if course:
             self.setWindowTitle(f"Course: {course.fullname}")
-            self.course_users_tree.set_course(course)
-            self.course_content_tree.set_course(course)
+            with self.course_users_tree.bulk_update():
+                self.course_users_tree.set_course(course)
+            with self.course_content_tree.bulk_update():
+                self.course_content_tree.set_course(course)
             self.update_action_states()
         else:
             self.setWindowTitle("Course")
@@ -159,9 +199,9 @@ class CourseForm(QMainWindow):
         enabled = self.course is not None
         self.open_course_action.setEnabled(enabled)
         self.open_users_action.setEnabled(enabled)
-        self.export_action.setEnabled(enabled)
+        self.export_action.setEnabled(enabled and self._export_task is None)
         self.refresh_action.setEnabled(enabled)
-        self.download_content_action.setEnabled(enabled)
+        self.download_content_action.setEnabled(enabled and self._download_task is None)
         self.show_resources_action.setEnabled(enabled)
         
     def open_course(self):
@@ -175,30 +215,58 @@ class CourseForm(QMainWindow):
             BrowserHelper.open_course_users(self.course)
             
     def export_to_excel(self):
-        """Export course data to Excel"""
-        if self.course:
-            try:
-                ReportsHelper.export_to_excel(self.course)
-                self.status_bar.showMessage("Export completed successfully", 3000)
-            except Exception as e:
-                LogHelper.log_error(f"Export failed: {str(e)}")
-                self.status_bar.showMessage("Export failed", 3000)
+        """Export course data to Excel in the background"""
+        if self.course and self._export_task is None:
+            self.export_action.setEnabled(False)
+            self.status_bar.showMessage("Exporting...")
+            # A fresh ReportsHelper per export, so concurrent exports never share a workbook
+            self._export_task = CourseTask(lambda course=self.course: ReportsHelper().export_course_to_excel(course))
+            self._export_task.signals.finished.connect(self.on_export_finished)
+            QThreadPool.globalInstance().start(self._export_task)
+            
+    def on_export_finished(self, success: bool, error: str):
+        """Handle the result of a background export"""
+        self._export_task = None
+        self.export_action.setEnabled(self.course is not None)
+        if success:
+            self.status_bar.showMessage("Export completed successfully", 3000)
+        else:
+            LogHelper.log_error(f"Export failed: {error}")
+            self.status_bar.showMessage("Export failed", 3000)
                 
+    def _tab_trees(self):
+        """Get the tree shown in each tab, in tab order"""
+        return (self.course_users_tree, self.course_content_tree)
+        
     def refresh(self):
-        """Refresh the course data"""
+        """Refresh the course data in the visible tab; other tabs refresh when shown"""
         if self.course:
-            self.course_users_tree.refresh()
-            self.course_content_tree.refresh()
+            current = self.tab_widget.currentIndex()
+            for index, tree in enumerate(self._tab_trees()):
+                if index == current:
+                    self._stale_trees.discard(tree)
+                    tree.refresh()
+                else:
+                    self._stale_trees.add(tree)
             
     def download_all_content(self):
-        """Download all course content"""
-        if self.course and self.course.lms:
-            try:
-                self.course.lms.download_all_course_content(self.course)
-                self.status_bar.showMessage("Download started", 3000)
-            except Exception as e:
-                LogHelper.log_error(f"Download failed: {str(e)}")
-                self.status_bar.showMessage("Download failed", 3000)
+        """Download all course content in the background"""
+        if self.course and self.course.lms and self._download_task is None:
+            self.download_content_action.setEnabled(False)
+            self.status_bar.showMessage("Download started", 3000)
+            self._download_task = CourseTask(partial(self.course.lms.download_all_course_content, self.course))
+            self._download_task.signals.finished.connect(self.on_download_finished)
+            QThreadPool.globalInstance().start(self._download_task)
+            
+    def on_download_finished(self, success: bool, error: str):
+        """Handle the result of a background content download"""
+        self._download_task = None
+        self.download_content_action.setEnabled(self.course is not None)
+        if success:
+            self.status_bar.showMessage("Download completed", 3000)
+        else:
+            LogHelper.log_error(f"Download failed: {error}")
+            self.status_bar.showMessage("Download failed", 3000)
                 
     def show_resources_only(self):
         """Show only resource modules"""
@@ -206,14 +274,22 @@ class CourseForm(QMainWindow):
             self.course_content_tree.show_only_resources()
             
     def on_filter_changed(self, text):
-        """Handle filter text change"""
+        """Handle filter text change, restarting the debounce timer"""
+        self._pending_filter = text
+        self._filter_timer.start()
+        
+    def _apply_filter(self):
+        """Filter the users tree by the last entered text"""
         if self.course_users_tree:
-            self.course_users_tree.filter_by_text(text)
+            self.course_users_tree.filter_by_text(self._pending_filter)
             
     def on_tab_changed(self, index):
-        """Handle tab change"""
-        # Update UI based on selected tab
-        pass
+        """Handle tab change, catching up on a refresh the tab missed while hidden"""
+        trees = self._tab_trees()
+        if 0 <= index < len(trees) and trees[index] in self._stale_trees:
+            self._stale_trees.discard(trees[index])
+            if self.course:
+                trees[index].refresh()
         
     def on_user_double_clicked(self, user):
         """Handle user double click"""
@@ -228,9 +304,11 @@ class CourseForm(QMainWindow):
             
     def closeEvent(self, event):
         """Handle form close event"""
-        # Clean up resources
-        if self.course_users_tree:
-            self.course_users_tree.clear_course()
-        if self.course_content_tree:
-            self.course_content_tree.clear_course()
+        # Clean up resources; a form deleted on close takes its trees with it
+        self._filter_timer.stop()
+        if not self.testAttribute(Qt.WA_DeleteOnClose):
+            if self.course_users_tree:
+                self.course_users_tree.clear_course()
+            if self.course_content_tree:
+                self.course_content_tree.clear_course()
         super().closeEvent(event)
@@ -6,12 +6,18 @@ Form for displaying section information and details
 from typing import Optional
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QLineEdit, QTextEdit, QPushButton, QGroupBox,
-                             QFormLayout, QTabWidget, QTableWidget, QTableWidgetItem,
+                             QFormLayout, QTabWidget, QTableView, QAbstractItemView,
                              QHeaderView, QApplication)
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from lms_interface import ISection, ICourse, IModule
+from helpers.lazy_tabs import replace_placeholder_tab
+from helpers.table_models import ListTableModel, RowStreamer
+from helpers.text_fields import set_text
+
+# Tables with more rows keep their default column widths
+_AUTO_SIZE_ROW_LIMIT = 500
 
 
 class SectionForm(QDialog):
@@ -23,8 +29,25 @@ class SectionForm(QDialog):
         self.section: Optional[ISection] = None
         self.course: Optional[ICourse] = None
         
+        # Modules tab is built on first show and refreshed only when visible
+        self.modules_table: Optional[QTableView] = None
+        self._modules_dirty = True
+        
         self.setup_ui()
-        self.setup_actions()
+        
+        # (field, section attribute) for each info field
+        self._info_bindings = [
+            (self.id_label, 'id'),
+            (self.name_edit, 'name'),
+            (self.section_number_edit, 'section_number'),
+            (self.visible_edit, 'visible'),
+            (self.highlight_edit, 'highlight'),
+            (self.summary_edit, 'summary'),
+            (self.time_created_edit, 'time_created'),
+            (self.time_modified_edit, 'time_modified'),
+            (self.description_edit, 'description'),
+            (self.notes_edit, 'notes'),
+        ]
         
     def setup_ui(self):
         """Setup the form UI"""
@@ -41,8 +64,9 @@ class SectionForm(QDialog):
         # Create info tab
         self.create_info_tab()
         
-        # Create modules tab
-        self.create_modules_tab()
+        # Add a placeholder for the modules tab; it is built on first show
+        self._modules_index = self.tab_widget.addTab(QWidget(), "Modules")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # Create button layout
         button_layout = QHBoxLayout()
@@ -136,32 +160,47 @@ class SectionForm(QDialog):
         modules_layout = QVBoxLayout(modules_widget)
         
         # Modules table
-        self.modules_table = QTableWidget()
-        self.modules_table.setColumnCount(5)
-        self.modules_table.setHorizontalHeaderLabels(["Name", "Type", "Visible", "Highlight", "Position"])
+        self.modules_model = ListTableModel(("Name", "Type", "Visible", "Highlight", "Position"),
+                                            ("name", "mod_name", "visible", "highlight", "position"), self)
+        self._modules_streamer = RowStreamer(self.modules_model)
+        self.modules_table = QTableView()
+        self.modules_table.setModel(self.modules_model)
         
-        # Set table properties
+        # Fixed interactive widths; measuring every row is only worth it for short tables
         header = self.modules_table.horizontalHeader()
         header.setStretchLastSection(False)
+        header.setDefaultSectionSize(120)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
         
-        self.modules_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.modules_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.modules_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.modules_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.modules_table.setAlternatingRowColors(True)
         
         modules_layout.addWidget(self.modules_table)
         
-        self.tab_widget.addTab(modules_widget, "Modules")
-        
-    def setup_actions(self):
-        """Setup actions and signals"""
         # Connect table double click
         self.modules_table.doubleClicked.connect(self.on_module_double_clicked)
         
+        return modules_widget
+        
+    def on_tab_changed(self, index: int):
+        """Build and fill the modules tab when it is shown"""
+        if index != self._modules_index:
+            return
+        
+        if self.modules_table is None:
+            replace_placeholder_tab(self.tab_widget, index, self.create_modules_tab())
+        
+        if self._modules_dirty:
+            self.update_modules_table()
+        
+    def _invalidate_modules(self):
+        """Refresh the modules tab now if it is shown, otherwise on its next show"""
+        self._modules_dirty = True
+        if self.tab_widget.currentIndex() == self._modules_index:
+            self.on_tab_changed(self._modules_index)
+        
     def set_section(self, section: ISection, course: Optional[ICourse] = None):
         """Set the section and update the form"""
         self.section = section
@@ -170,7 +209,7 @@ class SectionForm(QDialog):
         if section:
             self.setWindowTitle(f"Section: {section.name}")
             self.update_section_info()
-            self.update_modules_table()
+            self._invalidate_modules()
             self.update_button_states()
         else:
             self.setWindowTitle("Section Information")
@@ -181,28 +220,21 @@ class SectionForm(QDialog):
         if not self.section:
             return
             
-        self.id_label.setText(str(self.section.id))
-        self.name_edit.setText(self.section.name or "")
-        self.section_number_edit.setText(str(self.section.section_number) if self.section.section_number is not None else "")
-        self.visible_edit.setText(str(self.section.visible) if self.section.visible is not None else "")
-        self.highlight_edit.setText(str(self.section.highlight) if self.section.highlight is not None else "")
-        self.summary_edit.setText(self.section.summary or "")
-        self.time_created_edit.setText(self.section.time_created or "")
-        self.time_modified_edit.setText(self.section.time_modified or "")
-        self.description_edit.setText(self.section.description or "")
-        self.notes_edit.setText(self.section.notes or "")
+        for edit, attr in self._info_bindings:
+            value = getattr(self.section, attr, None)
+            set_text(edit, "" if value is None else str(value))
         
     def update_modules_table(self):
         """Update the modules table"""
-        self.modules_table.setRowCount(0)
-        
-        if not self.section:
+        if self.modules_table is None:
             return
-            
-        # This would typically load section modules from the LMS
-        # For now, we'll show a placeholder
-        # In a real implementation, you would get the section's modules
-        pass
+        self._modules_dirty = False
+        
+        # Show the first chunk right away and stream the rest in
+        modules = list(self.section.modules if self.section else [])
+        self._modules_streamer.start(modules)
+        if len(modules) < _AUTO_SIZE_ROW_LIMIT:
+            self.modules_table.resizeColumnsToContents()
         
     def update_button_states(self):
         """Update button enabled states"""
@@ -213,7 +245,7 @@ class SectionForm(QDialog):
         """Refresh section data"""
         if self.section:
             self.update_section_info()
-            self.update_modules_table()
+            self._invalidate_modules()
             
     def on_module_double_clicked(self, index):
         """Handle module double click"""
@@ -222,17 +254,12 @@ class SectionForm(QDialog):
         
     def clear_form(self):
         """Clear all form fields"""
-        self.id_label.setText("")
-        self.name_edit.setText("")
-        self.section_number_edit.setText("")
-        self.visible_edit.setText("")
-        self.highlight_edit.setText("")
-        self.summary_edit.setText("")
-        self.time_created_edit.setText("")
-        self.time_modified_edit.setText("")
-        self.description_edit.setText("")
-        self.notes_edit.setText("")
-        self.modules_table.setRowCount(0)
+        for edit, _attr in self._info_bindings:
+            edit.setText("")
+        if self.modules_table is not None:
+            self._modules_streamer.cancel()
+            self.modules_model.set_rows([])
+        self._modules_dirty = True
         
     def closeEvent(self, event):
         """Handle form close event"""
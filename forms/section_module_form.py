@@ -6,12 +6,18 @@ Form for displaying section module information and details
 from typing import Optional
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QLineEdit, QTextEdit, QPushButton, QGroupBox,
-                             QFormLayout, QTabWidget, QTableWidget, QTableWidgetItem,
+                             QFormLayout, QTabWidget, QTableView, QAbstractItemView,
                              QHeaderView, QApplication)
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from lms_interface import IModule, ICourse, ISection, IContent
+from helpers.lazy_tabs import replace_placeholder_tab
+from helpers.table_models import ListTableModel, RowStreamer
+from helpers.text_fields import set_text
+
+# Tables with more rows keep their default column widths
+_AUTO_SIZE_ROW_LIMIT = 500
 
 
 class SectionModuleForm(QDialog):
@@ -24,8 +30,29 @@ class SectionModuleForm(QDialog):
         self.course: Optional[ICourse] = None
         self.section: Optional[ISection] = None
         
+        # Contents tab is built on first show and refreshed only when visible
+        self.contents_table: Optional[QTableView] = None
+        self._contents_dirty = True
+        
         self.setup_ui()
-        self.setup_actions()
+        
+        # (field, module attribute) for each info field
+        self._info_bindings = [
+            (self.id_label, 'id'),
+            (self.name_edit, 'name'),
+            (self.instance_edit, 'instance'),
+            (self.modname_edit, 'modname'),
+            (self.modplural_edit, 'modplural'),
+            (self.position_edit, 'position'),
+            (self.visible_edit, 'visible'),
+            (self.highlight_edit, 'highlight'),
+            (self.uservisible_edit, 'uservisible'),
+            (self.indent_edit, 'indent'),
+            (self.time_created_edit, 'time_created'),
+            (self.time_modified_edit, 'time_modified'),
+            (self.description_edit, 'description'),
+            (self.notes_edit, 'notes'),
+        ]
         
     def setup_ui(self):
         """Setup the form UI"""
@@ -42,8 +69,9 @@ class SectionModuleForm(QDialog):
         # Create info tab
         self.create_info_tab()
         
-        # Create contents tab
-        self.create_contents_tab()
+        # Add a placeholder for the contents tab; it is built on first show
+        self._contents_index = self.tab_widget.addTab(QWidget(), "Contents")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # Create button layout
         button_layout = QHBoxLayout()
@@ -163,33 +191,47 @@ class SectionModuleForm(QDialog):
         contents_layout = QVBoxLayout(contents_widget)
         
         # Contents table
-        self.contents_table = QTableWidget()
-        self.contents_table.setColumnCount(6)
-        self.contents_table.setHorizontalHeaderLabels(["Name", "Type", "MIME Type", "Size", "Time Modified", "Visible"])
+        self.contents_model = ListTableModel(("Name", "Type", "MIME Type", "Size", "Time Modified", "Visible"),
+                                             ("file_name", "file_type", "mime_type", "file_size", "time_modified", "visible"), self)
+        self._contents_streamer = RowStreamer(self.contents_model)
+        self.contents_table = QTableView()
+        self.contents_table.setModel(self.contents_model)
         
-        # Set table properties
+        # Fixed interactive widths; measuring every row is only worth it for short tables
         header = self.contents_table.horizontalHeader()
         header.setStretchLastSection(False)
+        header.setDefaultSectionSize(120)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        
-        self.contents_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.contents_table.setSelectionBehavior(QTableWidget.SelectRows)
+        
+        self.contents_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.contents_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.contents_table.setAlternatingRowColors(True)
         
         contents_layout.addWidget(self.contents_table)
         
-        self.tab_widget.addTab(contents_widget, "Contents")
-        
-    def setup_actions(self):
-        """Setup actions and signals"""
         # Connect table double click
         self.contents_table.doubleClicked.connect(self.on_content_double_clicked)
         
+        return contents_widget
+        
+    def on_tab_changed(self, index: int):
+        """Build and fill the contents tab when it is shown"""
+        if index != self._contents_index:
+            return
+        
+        if self.contents_table is None:
+            replace_placeholder_tab(self.tab_widget, index, self.create_contents_tab())
+        
+        if self._contents_dirty:
+            self.update_contents_table()
+        
+    def _invalidate_contents(self):
+        """Refresh the contents tab now if it is shown, otherwise on its next show"""
+        self._contents_dirty = True
+        if self.tab_widget.currentIndex() == self._contents_index:
+            self.on_tab_changed(self._contents_index)
+        
     def set_module(self, module: IModule, course: Optional[ICourse] = None, section: Optional[ISection] = None):
         """Set the module and update the form"""
         self.module = module
@@ -199,7 +241,7 @@ class SectionModuleForm(QDialog):
         if module:
             self.setWindowTitle(f"Section Module: {module.name}")
             self.update_module_info()
-            self.update_contents_table()
+            self._invalidate_contents()
             self.update_button_states()
         else:
             self.setWindowTitle("Section Module Information")
@@ -210,32 +252,21 @@ class SectionModuleForm(QDialog):
         if not self.module:
             return
             
-        self.id_label.setText(str(self.module.id))
-        self.name_edit.setText(self.module.name or "")
-        self.instance_edit.setText(str(self.module.instance) if self.module.instance is not None else "")
-        self.modname_edit.setText(self.module.modname or "")
-        self.modplural_edit.setText(self.module.modplural or "")
-        self.position_edit.setText(str(self.module.position) if self.module.position is not None else "")
-        self.visible_edit.setText(str(self.module.visible) if self.module.visible is not None else "")
-        self.highlight_edit.setText(str(self.module.highlight) if self.module.highlight is not None else "")
-        self.uservisible_edit.setText(str(self.module.uservisible) if self.module.uservisible is not None else "")
-        self.indent_edit.setText(str(self.module.indent) if self.module.indent is not None else "")
-        self.time_created_edit.setText(self.module.time_created or "")
-        self.time_modified_edit.setText(self.module.time_modified or "")
-        self.description_edit.setText(self.module.description or "")
-        self.notes_edit.setText(self.module.notes or "")
+        for edit, attr in self._info_bindings:
+            value = getattr(self.module, attr, None)
+            set_text(edit, "" if value is None else str(value))
         
     def update_contents_table(self):
         """Update the contents table"""
-        self.contents_table.setRowCount(0)
-        
-        if not self.module:
+        if self.contents_table is None:
             return
-            
-        # This would typically load module contents from the LMS
-        # For now, we'll show a placeholder
-        # In a real implementation, you would get the module's contents
-        pass
+        self._contents_dirty = False
+        
+        # Show the first chunk right away and stream the rest in
+        contents = list(getattr(self.module, 'contents', None) or [])
+        self._contents_streamer.start(contents)
+        if len(contents) < _AUTO_SIZE_ROW_LIMIT:
+            self.contents_table.resizeColumnsToContents()
         
     def update_button_states(self):
         """Update button enabled states"""
@@ -253,7 +284,7 @@ class SectionModuleForm(QDialog):
         """Refresh module data"""
         if self.module:
             self.update_module_info()
-            self.update_contents_table()
+            self._invalidate_contents()
             
     def on_content_double_clicked(self, index):
         """Handle content double click"""
@@ -262,21 +293,12 @@ class SectionModuleForm(QDialog):
         
     def clear_form(self):
         """Clear all form fields"""
-        self.id_label.setText("")
-        self.name_edit.setText("")
-        self.instance_edit.setText("")
-        self.modname_edit.setText("")
-        self.modplural_edit.setText("")
-        self.position_edit.setText("")
-        self.visible_edit.setText("")
-        self.highlight_edit.setText("")
-        self.uservisible_edit.setText("")
-        self.indent_edit.setText("")
-        self.time_created_edit.setText("")
-        self.time_modified_edit.setText("")
-        self.description_edit.setText("")
-        self.notes_edit.setText("")
-        self.contents_table.setRowCount(0)
+        for edit, _attr in self._info_bindings:
+            edit.setText("")
+        if self.contents_table is not None:
+            self._contents_streamer.cancel()
+            self.contents_model.set_rows([])
+        self._contents_dirty = True
         
     def closeEvent(self, event):
         """Handle form close event"""
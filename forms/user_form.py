@@ -6,13 +6,19 @@ Form for displaying user information and details
 from typing import Optional
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QLineEdit, QTextEdit, QPushButton, QGroupBox,
-                             QFormLayout, QTabWidget, QTableWidget, QTableWidgetItem,
+                             QFormLayout, QTabWidget, QTableView, QAbstractItemView,
                              QHeaderView, QApplication)
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from lms_interface import IUser, ICourse
 from helpers.browser import BrowserHelper
+from helpers.lazy_tabs import replace_placeholder_tab
+from helpers.table_models import ListTableModel, RowStreamer
+from helpers.text_fields import set_text
+
+# Tables with more rows keep their default column widths
+_AUTO_SIZE_ROW_LIMIT = 500
 
 
 class UserForm(QDialog):
@@ -24,8 +30,27 @@ class UserForm(QDialog):
         self.user: Optional[IUser] = None
         self.course: Optional[ICourse] = None
         
+        # Courses tab is built on first show and refreshed only when visible
+        self.courses_table: Optional[QTableView] = None
+        self._courses_dirty = True
+        
         self.setup_ui()
-        self.setup_actions()
+        
+        # (field, user attribute) for each info field
+        self._info_bindings = [
+            (self.id_label, 'id'),
+            (self.username_edit, 'username'),
+            (self.firstname_edit, 'first_name'),
+            (self.lastname_edit, 'last_name'),
+            (self.fullname_edit, 'full_name'),
+            (self.email_edit, 'email'),
+            (self.roles_edit, 'roles'),
+            (self.last_access_edit, 'last_access'),
+            (self.last_access_from_edit, 'last_access_from'),
+            (self.time_created_edit, 'time_created'),
+            (self.time_modified_edit, 'time_modified'),
+            (self.notes_edit, 'notes'),
+        ]
         
     def setup_ui(self):
         """Setup the form UI"""
@@ -42,8 +67,9 @@ class UserForm(QDialog):
         # Create info tab
         self.create_info_tab()
         
-        # Create courses tab
-        self.create_courses_tab()
+        # Add a placeholder for the courses tab; it is built on first show
+        self._courses_index = self.tab_widget.addTab(QWidget(), "Courses")
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         # Create button layout
         button_layout = QHBoxLayout()
@@ -143,31 +169,46 @@ class UserForm(QDialog):
         courses_layout = QVBoxLayout(courses_widget)
         
         # Courses table
-        self.courses_table = QTableWidget()
-        self.courses_table.setColumnCount(4)
-        self.courses_table.setHorizontalHeaderLabels(["Course", "Role", "Last Access", "Status"])
+        self.courses_model = ListTableModel(("Course", "ID"), ("name", "id"), self)
+        self._courses_streamer = RowStreamer(self.courses_model)
+        self.courses_table = QTableView()
+        self.courses_table.setModel(self.courses_model)
         
-        # Set table properties
+        # Fixed interactive widths; measuring every row is only worth it for short tables
         header = self.courses_table.horizontalHeader()
         header.setStretchLastSection(False)
+        header.setDefaultSectionSize(120)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         
-        self.courses_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.courses_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.courses_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.courses_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.courses_table.setAlternatingRowColors(True)
         
         courses_layout.addWidget(self.courses_table)
         
-        self.tab_widget.addTab(courses_widget, "Courses")
-        
-    def setup_actions(self):
-        """Setup actions and signals"""
         # Connect table double click
         self.courses_table.doubleClicked.connect(self.on_course_double_clicked)
         
+        return courses_widget
+        
+    def on_tab_changed(self, index: int):
+        """Build and fill the courses tab when it is shown"""
+        if index != self._courses_index:
+            return
+        
+        if self.courses_table is None:
+            replace_placeholder_tab(self.tab_widget, index, self.create_courses_tab())
+        
+        if self._courses_dirty:
+            self.update_courses_table()
+        
+    def _invalidate_courses(self):
+        """Refresh the courses tab now if it is shown, otherwise on its next show"""
+        self._courses_dirty = True
+        if self.tab_widget.currentIndex() == self._courses_index:
+            self.on_tab_changed(self._courses_index)
+        
     def set_user(self, user: IUser, course: Optional[ICourse] = None):
         """Set the user and update the form"""
         self.user = user
@@ -176,7 +217,7 @@ class UserForm(QDialog):
         if user:
             self.setWindowTitle(f"User: {user.full_name or user.username}")
             self.update_user_info()
-            self.update_courses_table()
+            self._invalidate_courses()
             self.update_button_states()
         else:
             self.setWindowTitle("User Information")
@@ -187,30 +228,26 @@ class UserForm(QDialog):
         if not self.user:
             return
             
-        self.id_label.setText(str(self.user.id))
-        self.username_edit.setText(self.user.username or "")
-        self.firstname_edit.setText(self.user.first_name or "")
-        self.lastname_edit.setText(self.user.last_name or "")
-        self.fullname_edit.setText(self.user.full_name or "")
-        self.email_edit.setText(self.user.email or "")
-        self.roles_edit.setText(self.user.roles or "")
-        self.last_access_edit.setText(self.user.last_access or "")
-        self.last_access_from_edit.setText(self.user.last_access_from or "")
-        self.time_created_edit.setText(self.user.time_created or "")
-        self.time_modified_edit.setText(self.user.time_modified or "")
-        self.notes_edit.setText(self.user.notes or "")
+        for edit, attr in self._info_bindings:
+            value = getattr(self.user, attr, None)
+            if value is None:
+                value = ""
+            elif isinstance(value, (list, tuple)):
+                # e.g. roles
+                value = ", ".join(map(str, value))
+            set_text(edit, str(value))
         
     def update_courses_table(self):
         """Update the courses table"""
-        self.courses_table.setRowCount(0)
-        
-        if not self.user:
+        if self.courses_table is None:
             return
-            
-        # This would typically load user's courses from the LMS
-        # For now, we'll show a placeholder
-        # In a real implementation, you would get the user's enrolled courses
-        pass
+        self._courses_dirty = False
+        
+        # Show the first chunk right away and stream the rest in
+        courses = list(self.user.get_other_enrolled_courses() if self.user else [])
+        self._courses_streamer.start(courses)
+        if len(courses) < _AUTO_SIZE_ROW_LIMIT:
+            self.courses_table.resizeColumnsToContents()
         
     def update_button_states(self):
         """Update button enabled states"""
@@ -240,19 +277,12 @@ class UserForm(QDialog):
         
     def clear_form(self):
         """Clear all form fields"""
-        self.id_label.setText("")
-        self.username_edit.setText("")
-        self.firstname_edit.setText("")
-        self.lastname_edit.setText("")
-        self.fullname_edit.setText("")
-        self.email_edit.setText("")
-        self.roles_edit.setText("")
-        self.last_access_edit.setText("")
-        self.last_access_from_edit.setText("")
-        self.time_created_edit.setText("")
-        self.time_modified_edit.setText("")
-        self.notes_edit.setText("")
-        self.courses_table.setRowCount(0)
+        for edit, _attr in self._info_bindings:
+            edit.setText("")
+        if self.courses_table is not None:
+            self._courses_streamer.cancel()
+            self.courses_model.set_rows([])
+        self._courses_dirty = True
         
     def closeEvent(self, event):
         """Handle form close event"""
@@ -0,0 +1,20 @@
+"""
+Lazy tab helpers for LMS Explorer
+Swaps placeholder tabs for their real content on first show
+"""
+
+from PyQt5.QtWidgets import QTabWidget, QWidget
+
+
+def replace_placeholder_tab(tab_widget: QTabWidget, index: int, widget: QWidget):
+    """Replace the placeholder tab at index with widget, keeping it current"""
+    placeholder = tab_widget.widget(index)
+    label = tab_widget.tabText(index)
+    tab_widget.blockSignals(True)
+    try:
+        tab_widget.removeTab(index)
+        tab_widget.insertTab(index, widget, label)
+        tab_widget.setCurrentIndex(index)
+    finally:
+        tab_widget.blockSignals(False)
+    placeholder.deleteLater()
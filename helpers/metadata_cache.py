@@ -0,0 +1,69 @@
+"""
+Metadata cache helper for LMS Explorer
+Skips re-fetching LMS data that was fetched recently
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# Fetched data counts as fresh for this many seconds
+DEFAULT_TTL = 300.0
+
+
+class MetadataCache:
+    """Remembers when LMS data was last fetched for an object"""
+    
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        # (kind, LMS host, object ID) -> fetch time
+        self._fetched: Dict[Tuple[str, Optional[str], Hashable], float] = {}
+    
+    @staticmethod
+    def _key(kind: str, obj: Any) -> Tuple[str, Optional[str], Hashable]:
+        """Build a key that stays stable for the same LMS object across reloads"""
+        lms = getattr(obj, 'lms', None)
+        return (kind, lms.get_host() if lms else None, obj.id)
+    
+    def _evict_expired(self, now: float):
+        """Drop the entries older than the TTL"""
+        expired = [key for key, fetched_at in self._fetched.items() if now - fetched_at >= self.ttl]
+        for key in expired:
+            del self._fetched[key]
+    
+    def is_fresh(self, kind: str, obj: Any) -> bool:
+        """Check whether this kind of data was fetched for obj within the TTL"""
+        key = self._key(kind, obj)
+        fetched_at = self._fetched.get(key)
+        if fetched_at is None:
+            return False
+        if time.monotonic() - fetched_at < self.ttl:
+            return True
+        del self._fetched[key]
+        return False
+    
+    def mark_fetched(self, kind: str, obj: Any):
+        """Record that this kind of data was just fetched for obj"""
+        now = time.monotonic()
+        self._evict_expired(now)
+        self._fetched[self._key(kind, obj)] = now
+    
+    def invalidate(self, kind: str, obj: Any):
+        """Force the next freshness check for this kind of data and obj to fail"""
+        self._fetched.pop(self._key(kind, obj), None)
+    
+    def clear(self):
+        """Forget all fetch times"""
+        self._fetched.clear()
+
+
+# Global metadata cache instance
+_global_metadata_cache: Optional[MetadataCache] = None
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Get the global metadata cache instance"""
+    global _global_metadata_cache
+    if _global_metadata_cache is None:
+        _global_metadata_cache = MetadataCache()
+    return _global_metadata_cache
@@ -0,0 +1,99 @@
+"""
+Table model helpers for LMS Explorer
+List-backed table models and chunked row streaming for read-only tables
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+from PyQt5.QtCore import Qt, QObject, QTimer, QAbstractTableModel, QModelIndex
+
+
+# Rows past the first chunk are appended one chunk per event loop pass
+DEFAULT_CHUNK_SIZE = 200
+
+
+class ListTableModel(QAbstractTableModel):
+    """Table model over a list of objects, showing one attribute per column"""
+    
+    def __init__(self, headers: Sequence[str], attributes: Sequence[str], parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._attributes = tuple(attributes)
+        self._rows: List[Any] = []
+    
+    def set_rows(self, rows: Iterable[Any]):
+        """Replace the listed rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def append_rows(self, rows: Sequence[Any]):
+        """Append rows after the listed ones"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+    
+    def row(self, row: int) -> Any:
+        return self._rows[row]
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        value = getattr(self._rows[index.row()], self._attributes[index.column()], None)
+        return "" if value is None else str(value)
+    
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._headers[section]
+        return None
+
+
+class RowStreamer(QObject):
+    """Fills a ListTableModel a chunk at a time, yielding to the event loop between chunks"""
+    
+    def __init__(self, model: ListTableModel, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        super().__init__(model)
+        self.model = model
+        self.chunk_size = chunk_size
+        self._chunks: Optional[Iterator[List[Any]]] = None
+        self._scheduled = False
+    
+    def start(self, rows: Iterable[Any]):
+        """Show the first chunk of rows right away and stream the rest in"""
+        rows = list(rows)
+        size = self.chunk_size
+        chunks = (rows[start:start + size] for start in range(0, len(rows), size))
+        self._chunks = chunks
+        self.model.set_rows(next(chunks, []))
+        if len(rows) > size:
+            self._schedule()
+    
+    def cancel(self):
+        """Drop any chunks not inserted yet"""
+        self._chunks = None
+    
+    def _schedule(self):
+        # A single pending timer serves whichever rows were started last
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._insert_next)
+    
+    def _insert_next(self):
+        """Append the next chunk of rows, then yield to the event loop"""
+        self._scheduled = False
+        if self._chunks is None:
+            return
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._chunks = None
+            return
+        self.model.append_rows(chunk)
+        self._schedule()
@@ -0,0 +1,18 @@
+"""
+Text field helpers for LMS Explorer
+Writes text into read-only form fields only when it changes
+"""
+
+from PyQt5.QtCore import QSignalBlocker
+from PyQt5.QtWidgets import QTextEdit
+
+
+def set_text(widget, text: str):
+    """Set a label, line edit or text edit's text without emitting change signals, skipping unchanged text"""
+    if isinstance(widget, QTextEdit):
+        if widget.toPlainText() != text:
+            with QSignalBlocker(widget):
+                widget.setPlainText(text)
+    elif widget.text() != text:
+        with QSignalBlocker(widget):
+            widget.setText(text)
@@ -3,8 +3,9 @@ Utility functions for LMS Explorer
 """
 
 import datetime
+import html
 import re
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 
 class Utils:
@@ -113,3 +114,9 @@ class Utils:
         p = math.pow(1024, i)
         s = round(size_bytes / p, 2)
         return f"{s} {size_names[i]}"
+    
+    @staticmethod
+    def details_html(rows: Iterable[Tuple[str, object]]) -> str:
+        """Render (label, value) rows as HTML lines with bold labels"""
+        return "<br>".join(f"<b>{html.escape(label)}:</b> {html.escape(str(value))}"
+                           for label, value in rows)
@@ -10,6 +10,8 @@ from typing import List, Optional, Dict, Any
 class IGradeItem(ABC):
     """Interface for grade items"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_item_name(self) -> str:
         """Get the name of the grade item"""
@@ -24,6 +26,8 @@ class IGradeItem(ABC):
 class IUsersGroup(ABC):
     """Interface for user groups"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_filter_content(self) -> str:
         """Get filter content for the group"""
@@ -69,6 +73,8 @@ class IUsersGroup(ABC):
 class IUser(ABC):
     """Interface for users"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_course(self) -> 'ICourse':
         """Get the course this user belongs to"""
@@ -159,6 +165,8 @@ class IUser(ABC):
 class ICourse(ABC):
     """Interface for courses"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_category(self) -> 'ICategory':
         """Get the category this course belongs to"""
@@ -240,6 +248,8 @@ class ICourse(ABC):
 class ICategory(ABC):
     """Interface for categories"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_courses(self) -> List[ICourse]:
         """Get courses in this category"""
@@ -286,6 +296,8 @@ class ICategory(ABC):
 class IModule(ABC):
     """Interface for modules"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_filter_content(self) -> str:
         """Get filter content for the module"""
@@ -332,6 +344,8 @@ class IModule(ABC):
 class ISection(ABC):
     """Interface for sections"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_course(self) -> Optional['ICourse']:
         """Get the course this section belongs to"""
@@ -378,6 +392,8 @@ class ISection(ABC):
 class ILMS(ABC):
     """Interface for LMS (Learning Management System)"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_categories(self) -> List[ICategory]:
         """Get all LMS categories"""
@@ -457,6 +473,8 @@ class ILMS(ABC):
 class IContent(ABC):
     """Interface for content files"""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_file_name(self) -> str:
         """Get the file name"""
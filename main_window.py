@@ -27,6 +27,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.lms_interface = LMS()
         self.config_manager = ConfigManager()
+        self._about_dialog = None
         
         self.init_ui()
         self.load_config()
@@ -715,8 +716,10 @@ class MainWindow(QMainWindow):
     
     def on_about(self):
         """Handle about action"""
-        dialog = AboutDialog(self)
-        dialog.exec_()
+        # The about dialog is static, so build it once and reopen it
+        if self._about_dialog is None:
+            self._about_dialog = AboutDialog(self)
+        self._about_dialog.exec_()
         
     def on_refresh(self):
         """Handle refresh action"""
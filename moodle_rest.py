@@ -7,6 +7,27 @@ import requests
 import json
 from typing import Dict, List, Any, Optional
 from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled session that retries failed idempotent requests briefly"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Session shared by every client and dialog so DNS, TCP and TLS setup is reused
+_shared_session: requests.Session = _build_session()
+
+
+def get_shared_session() -> requests.Session:
+    """Get the HTTP session shared across the application"""
+    return _shared_session
 
 
 class MoodleRestClient:
@@ -25,13 +46,14 @@ class MoodleRestClient:
     CORE_GRADE_GET_GRADE_ITEMS = "core_grade_get_grade_items"
     CORE_GRADE_GET_GRADES = "core_grade_get_grades"
     
-    def __init__(self, host: str, username: str = "", password: str = "", service: str = "moodle_mobile_app"):
+    def __init__(self, host: str, username: str = "", password: str = "", service: str = "moodle_mobile_app",
+                 session: Optional[requests.Session] = None):
         self.host = host.rstrip('/')
         self.username = username
         self.password = password
         self.service = service
         self.token = ""
-        self.session = requests.Session()
+        self.session = session if session is not None else _shared_session
         
     def connect(self) -> bool:
         """Connect to Moodle and get authentication token"""
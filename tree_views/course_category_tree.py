@@ -170,13 +170,13 @@ class CourseCategoryTreeWidget(CustomTreeWidget):
             # Check if this item matches the filter
             compare_text = ""
             if data.node_type == NodeTypes.COURSE and data.course:
-                compare_text = data.course.filter_content
+                compare_text = data.course.filter_content_lower
             elif data.node_type == NodeTypes.GROUP and data.group:
-                compare_text = data.group.filter_content
+                compare_text = data.group.filter_content_lower
             elif data.node_type == NodeTypes.USER and data.user:
-                compare_text = data.user.filter_content
+                compare_text = data.user.filter_content_lower
                 
-            if filter_text in compare_text.lower():
+            if filter_text in compare_text:
                 should_show = True
                 
         # Check children
@@ -207,13 +207,13 @@ class CourseContentTreeWidget(CustomTreeWidget):
             # Check if this item matches the filter
             compare_text = ""
             if data.node_type == NodeTypes.SECTION and data.section:
-                compare_text = data.section.name
+                compare_text = data.section.name.lower()
             elif data.node_type in [NodeTypes.MODULE, NodeTypes.MODULE_ONE] and data.module:
-                compare_text = data.module.name
+                compare_text = data.module.name.lower()
             elif data.node_type == NodeTypes.CONTENT and data.content:
-                compare_text = data.content.filter_content
+                compare_text = data.content.filter_content_lower
                 
-            if filter_text in compare_text.lower():
+            if filter_text in compare_text:
                 should_show = True
                 
         # Check children
@@ -5,12 +5,39 @@ Tree view for displaying users in a specific course
 
 from typing import Optional, List
 from PyQt5.QtWidgets import QTreeWidgetItem, QMenu, QAction, QHeaderView
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 from lms_interface import ICourse, IUser, IUsersGroup
 from tree_views.custom_tree import CustomTreeWidget, TreeData, NodeTypes
 from helpers.browser import BrowserHelper
+from helpers.metadata_cache import get_metadata_cache
+
+
+class EnrolledUsersSignals(QObject):
+    """Signals emitted by EnrolledUsersTask"""
+    
+    # Emitted with the fetch generation, the course and the raw user records
+    # (None if the fetch failed)
+    finished = pyqtSignal(int, object, object)
+
+
+class EnrolledUsersTask(QRunnable):
+    """Fetches a course's raw enrolled users records from the LMS, off the GUI thread"""
+    
+    def __init__(self, generation: int, course: ICourse):
+        super().__init__()
+        self.generation = generation
+        self.course = course
+        self.signals = EnrolledUsersSignals()
+    
+    def run(self):
+        # Only the REST call runs here; the course is updated on the GUI thread
+        enrolled_users_data = None
+        try:
+            enrolled_users_data = self.course.fetch_enrolled_users_data()
+        finally:
+            self.signals.finished.emit(self.generation, self.course, enrolled_users_data)
 
 
 class CourseUsersTreeWidget(CustomTreeWidget):
@@ -24,6 +51,9 @@ class CourseUsersTreeWidget(CustomTreeWidget):
         super().__init__(parent)
         
         self.course: Optional[ICourse] = None
+        self._fetch_task: Optional[EnrolledUsersTask] = None
+        # Bumped for every fetch started or abandoned, so stale results are dropped
+        self._fetch_generation = 0
         self.setup_ui()
         
     def setup_ui(self):
@@ -49,13 +79,39 @@ class CourseUsersTreeWidget(CustomTreeWidget):
     def populate_tree(self):
         """Populate the tree with course users data"""
         self.clear()
+        self._fetch_generation += 1
+        self._fetch_task = None
         
         if not self.course:
             return
             
-        # Refresh enrolled users
-        self.course.refresh_enrolled_users()
+        # Users fetched within the cache TTL are shown right away
+        if get_metadata_cache().is_fresh('enrolled_users', self.course):
+            self._fill_tree()
+            return
+        
+        # Otherwise show a placeholder row and fetch the users in the background
+        loading_item = QTreeWidgetItem(self, ["Loading..."])
+        loading_item.setFlags(Qt.NoItemFlags)
+        self._fetch_task = EnrolledUsersTask(self._fetch_generation, self.course)
+        self._fetch_task.signals.finished.connect(self.on_users_fetched)
+        QThreadPool.globalInstance().start(self._fetch_task)
+        
+    def on_users_fetched(self, generation: int, course: ICourse, enrolled_users_data):
+        """Apply the fetched users to the course and fill the tree"""
+        # Drop results of fetches that were superseded or abandoned
+        if generation != self._fetch_generation or course is not self.course:
+            return
+        self._fetch_task = None
+        if enrolled_users_data is not None:
+            course.apply_enrolled_users_data(enrolled_users_data)
+            get_metadata_cache().mark_fetched('enrolled_users', course)
+        with self.bulk_update():
+            self.clear()
+            self._fill_tree()
         
+    def _fill_tree(self):
+        """Add the course's groups or users to the tree"""
         # Check if course has groups
         if self.course.user_groups and len(self.course.user_groups) > 0:
             # Show groups structure
@@ -67,7 +123,7 @@ class CourseUsersTreeWidget(CustomTreeWidget):
             # Show flat users list
             self.setHeaderLabels(["Full Name", "First Name", "Last Name", "Email", "Roles", "Last Access", "Last Access From"])
             
-            for user in self.course.users:
+            for user in self.course.enrolled_users:
                 self.add_user_item(user)
                 
         # Auto-resize columns
@@ -158,11 +214,11 @@ class CourseUsersTreeWidget(CustomTreeWidget):
             # Check if this item matches the filter
             compare_text = ""
             if data.node_type == NodeTypes.GROUP and data.group:
-                compare_text = data.group.filter_content
+                compare_text = data.group.filter_content_lower
             elif data.node_type == NodeTypes.USER and data.user:
-                compare_text = data.user.filter_content
+                compare_text = data.user.filter_content_lower
                 
-            if filter_text in compare_text.lower():
+            if filter_text in compare_text:
                 should_show = True
                 
         # Check children
@@ -227,10 +283,14 @@ class CourseUsersTreeWidget(CustomTreeWidget):
             BrowserHelper.open_user_profile(self.course, user)
             
     def refresh(self):
-        """Refresh the tree"""
+        """Refresh the tree, re-fetching the enrolled users"""
+        if self.course:
+            get_metadata_cache().invalidate('enrolled_users', self.course)
         self.populate_tree()
         
     def clear_course(self):
         """Clear the course from the tree"""
         self.clear()
         self.course = None
+        self._fetch_task = None
+        self._fetch_generation += 1
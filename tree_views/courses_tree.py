@@ -114,7 +114,7 @@ class CoursesTreeWidget(CustomTreeWidget):
             data = self.get_item_data(item)
             
             if data and data.node_type == NodeTypes.COURSE and data.course:
-                compare_text = data.course.filter_content.lower()
+                compare_text = data.course.filter_content_lower
                 item.setHidden(filter_text not in compare_text)
             else:
                 item.setHidden(True)
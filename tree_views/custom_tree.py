@@ -3,6 +3,7 @@ Custom Tree Widget Base Class
 Base class for all LMS tree widgets with common functionality
 """
 
+from contextlib import contextmanager
 from enum import Enum
 from typing import Optional, Any, List
 from PyQt5.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu, QApplication
@@ -10,7 +11,7 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QColor, QIcon
 
 from lms_interface import ILMS, ICourse, ICategory, IUser, IUsersGroup, ISection, IModule, IContent
-from helpers.images import ImageHelper
+from helpers.images import get_image_helper
 
 
 class NodeTypes(Enum):
@@ -51,7 +52,8 @@ class CustomTreeWidget(QTreeWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        self.image_helper = ImageHelper()
+        # Shared helper, so icons are decoded once per process rather than per tree
+        self.image_helper = get_image_helper()
         self.setup_ui()
         
     def setup_ui(self):
@@ -80,6 +82,18 @@ class CustomTreeWidget(QTreeWidget):
         header.setStretchLastSection(False)
         header.setSectionResizeMode(0, header.Stretch)
         
+    @contextmanager
+    def bulk_update(self):
+        """Suspend sorting and repaints while the tree is (re)populated"""
+        sorting_enabled = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.setSortingEnabled(False)
+        try:
+            yield self
+        finally:
+            self.setSortingEnabled(sorting_enabled)
+            self.setUpdatesEnabled(True)
+        
     def create_tree_item(self, parent: QTreeWidgetItem, data: TreeData, 
                         name: str, id_text: str = "", type_text: str = "") -> QTreeWidgetItem:
         """Create a tree item with the given data"""
@@ -166,17 +180,17 @@ class CustomTreeWidget(QTreeWidget):
             # Check if this item matches the filter
             compare_text = ""
             if data.node_type == NodeTypes.LMS and data.lms:
-                compare_text = f"{data.lms.name} {data.lms.host}"
+                compare_text = f"{data.lms.name} {data.lms.host}".lower()
             elif data.node_type == NodeTypes.CATEGORY and data.category:
-                compare_text = data.category.name
+                compare_text = data.category.name.lower()
             elif data.node_type == NodeTypes.COURSE and data.course:
-                compare_text = data.course.filter_content
+                compare_text = data.course.filter_content_lower
             elif data.node_type == NodeTypes.USER and data.user:
-                compare_text = data.user.filter_content
+                compare_text = data.user.filter_content_lower
             elif data.node_type == NodeTypes.GROUP and data.group:
-                compare_text = data.group.filter_content
+                compare_text = data.group.filter_content_lower
                 
-            if filter_text in compare_text.lower():
+            if filter_text in compare_text:
                 should_show = True
                 
         # Check children
@@ -57,7 +57,7 @@ class LMSTreeWidget(CustomTreeWidget):
             
         # Get categories from connection
         self.lms.get_categories_from_connection()
-        self.lms.get_courses()
+        self.lms.fetch_courses()
         
         # Add first level categories
         for category in self.lms.first_level_categories:
@@ -151,11 +151,11 @@ class LMSTreeWidget(CustomTreeWidget):
             # Check if this item matches the filter
             compare_text = ""
             if data.node_type == NodeTypes.CATEGORY and data.category:
-                compare_text = data.category.name
+                compare_text = data.category.name.lower()
             elif data.node_type == NodeTypes.COURSE and data.course:
-                compare_text = data.course.filter_content
+                compare_text = data.course.filter_content_lower
                 
-            if filter_text in compare_text.lower():
+            if filter_text in compare_text:
                 should_show = True
                 
         # Check children
@@ -96,7 +96,7 @@ class UsersTreeWidget(CustomTreeWidget):
             data = self.get_item_data(item)
             
             if data and data.node_type == NodeTypes.USER and data.user:
-                compare_text = data.user.filter_content.lower()
+                compare_text = data.user.filter_content_lower
                 item.setHidden(filter_text not in compare_text)
             else:
                 item.setHidden(True)
@@ -63,6 +63,25 @@ def ensure_directory_exists(path: str) -> bool:
         return False
 
 
+def atomic_write_bytes(path: str, data: bytes, mode: Optional[int] = None):
+    """Write data to a file atomically via a temporary file and os.replace"""
+    tmp_path = path + '.tmp'
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    fd = os.open(tmp_path, flags, mode if mode is not None else 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def is_valid_url(url: str) -> bool:
     """Check if a URL is valid"""
     if not url: